@@ -1,4 +1,8 @@
+import queue
 import sqlite3
+import threading
+import time
+from concurrent.futures import Future
 
 class HashTable:
     def __init__(self):
@@ -16,9 +20,171 @@ class HashTable:
     def retrieve(self, key):
         return self.table.get(key, None)
 
+def configure_connection(conn):
+    # WAL lets the UI connection read while the writer commits; NORMAL only fsyncs at checkpoints
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+
+class _Call:
+    __slots__ = ("future", "fn", "args")
+
+    def __init__(self, fn, args):
+        self.future = Future()
+        self.fn = fn
+        self.args = args
+
+class DatabaseWriter:
+    """Applies queued writes on a background thread with its own connection.
+
+    Everything queued since the last commit goes into one transaction, so a
+    burst of session logs and score updates costs one disk sync and never
+    blocks the render thread. Each item runs under its own savepoint, so one
+    that fails is rolled back alone and the rest of the batch still commits.
+    call() runs a function against the same connection and hands back a
+    Future that resolves once it has committed.
+    """
+
+    def __init__(self, db_path):
+        self.db_path = db_path
+        self.queue = queue.Queue()
+        self.batches = 0
+        self.writes = 0
+        self.thread = threading.Thread(target=self.run, name="db-writer", daemon=True)
+        self.thread.start()
+
+    def submit(self, sql, params=()):
+        self.queue.put([(sql, params)])
+
+    def submit_all(self, statements):
+        """Queue statements that must land in the same transaction."""
+        self.queue.put(list(statements))
+
+    def call(self, fn, *args):
+        """Run fn(conn, *args) on the writer thread; returns a Future for its result."""
+        call = _Call(fn, args)
+        self.queue.put(call)
+        return call.future
+
+    def run(self):
+        # Transactions are opened and committed by hand so each item can get a savepoint
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        configure_connection(conn)
+        running = True
+        while running:
+            batch = [self.queue.get()]
+            while True:
+                try:
+                    batch.append(self.queue.get_nowait())
+                except queue.Empty:
+                    break
+            running = None not in batch
+            completed = []
+            try:
+                conn.execute("BEGIN")
+                for item in batch:
+                    if item is not None:
+                        self.apply(conn, item, completed)
+                conn.execute("COMMIT")
+                self.batches += 1
+                for future, result in completed:
+                    future.set_result(result)
+            except Exception as e:
+                # Only the commit itself, or the connection, fails here; nothing in the batch landed
+                print(f"Database write failed: {e}")
+                try:
+                    conn.rollback()
+                except sqlite3.Error:
+                    pass
+                for item in batch:
+                    if isinstance(item, _Call) and not item.future.done():
+                        item.future.set_exception(e)
+            finally:
+                for _ in batch:
+                    self.queue.task_done()
+        conn.close()
+
+    def apply(self, conn, item, completed):
+        """Run one queued item under a savepoint, so a failure only undoes that item."""
+        if isinstance(item, _Call) and not item.future.set_running_or_notify_cancel():
+            # Cancelled by a caller that gave up waiting
+            return
+        conn.execute("SAVEPOINT item")
+        try:
+            if isinstance(item, _Call):
+                result = item.fn(conn, *item.args)
+            else:
+                for sql, params in item:
+                    conn.execute(sql, params)
+        except Exception as e:
+            conn.execute("ROLLBACK TO item")
+            conn.execute("RELEASE item")
+            print(f"Database write failed: {e}")
+            if isinstance(item, _Call):
+                item.future.set_exception(e)
+            return
+        conn.execute("RELEASE item")
+        if isinstance(item, _Call):
+            completed.append((item.future, result))
+        else:
+            self.writes += len(item)
+
+    def flush(self):
+        """Block until everything queued so far is committed."""
+        self.queue.join()
+
+    def close(self):
+        self.queue.put(None)
+        self.thread.join()
+
+# Both resolve the user's id on the writer thread, so logging never queries from the UI
+INSERT_GAME_SESSION = """
+    INSERT INTO game_sessions (user_id, score, timestamp, lives_lost)
+    SELECT id, ?, ?, ? FROM users WHERE username = ?
+"""
+
+UPSERT_USER_STATS = """
+    INSERT INTO user_stats (user_id, sessions, total_lives_lost, total_score, best_score, last_played)
+    SELECT id, 1, ?, ?, ?, ? FROM users WHERE username = ?
+    ON CONFLICT (user_id) DO UPDATE SET
+        sessions = sessions + 1,
+        total_lives_lost = total_lives_lost + excluded.total_lives_lost,
+        total_score = total_score + excluded.total_score,
+        best_score = MAX(best_score, excluded.best_score),
+        last_played = excluded.last_played
+"""
+
+class Leaderboard:
+    """Top players kept in memory; the database is only queried again after a score changes."""
+
+    def __init__(self, db, size=5):
+        self.db = db
+        self.size = size
+        self.entries = None
+        self.queries = 0
+        # Scores handed to the writer this session, which a query may not see yet
+        self.recorded = {}
+
+    def top(self):
+        if self.entries is None:
+            scores = dict(self.db.get_top_players(self.size))
+            for username, score in self.recorded.items():
+                scores[username] = max(score, scores.get(username, 0))
+            self.entries = sorted(scores.items(), key=lambda entry: -entry[1])[:self.size]
+            self.queries += 1
+        return self.entries
+
+    def record(self, username, score):
+        if score > self.recorded.get(username, 0):
+            self.recorded[username] = score
+            self.invalidate()
+
+    def invalidate(self):
+        self.entries = None
+
 class Database:
     def __init__(self, db_path="auth/users.db"):
         self.conn = sqlite3.connect(db_path)
+        configure_connection(self.conn)
         self.cursor = self.conn.cursor()
         self.hashtable = HashTable()
 
@@ -42,7 +208,40 @@ class Database:
                 FOREIGN KEY (user_id) REFERENCES users(id)
             )
         """)
+        # per-user aggregates, kept current by log_game_session
+        self.cursor.execute("""
+            CREATE TABLE IF NOT EXISTS user_stats (
+                user_id INTEGER PRIMARY KEY,
+                sessions INTEGER NOT NULL DEFAULT 0,
+                total_lives_lost INTEGER NOT NULL DEFAULT 0,
+                total_score INTEGER NOT NULL DEFAULT 0,
+                best_score INTEGER NOT NULL DEFAULT 0,
+                last_played TEXT,
+                FOREIGN KEY (user_id) REFERENCES users(id)
+            )
+        """)
+        # leaderboard reads walk this index instead of sorting the whole table
+        self.cursor.execute("CREATE INDEX IF NOT EXISTS idx_users_highest_score ON users (highest_score DESC)")
         self.conn.commit()
+        self.migrate()
+        self.leaderboard = Leaderboard(self)
+        self.writer = DatabaseWriter(db_path)
+
+    def migrate(self):
+        """One-time data migrations, tracked in PRAGMA user_version."""
+        version = self.cursor.execute("PRAGMA user_version").fetchone()[0]
+        if version < 1:
+            # Backfill user_stats from the sessions logged before it existed
+            with self.conn:
+                self.conn.execute("DELETE FROM user_stats")
+                self.conn.execute("""
+                    INSERT INTO user_stats (user_id, sessions, total_lives_lost, total_score, best_score, last_played)
+                    SELECT user_id, COUNT(*), COALESCE(SUM(lives_lost), 0), COALESCE(SUM(score), 0), COALESCE(MAX(score), 0), MAX(timestamp)
+                    FROM game_sessions
+                    WHERE user_id IS NOT NULL
+                    GROUP BY user_id
+                """)
+                self.conn.execute("PRAGMA user_version = 1")
 
     @staticmethod
     def hash_password(password):
@@ -52,50 +251,73 @@ class Database:
         hashtable.store(password, hashed_password)
         return str(hashed_password)
 
-    def signup_user(self, username, password):
+    @classmethod
+    def _signup(cls, conn, username, password):
         try:
-            self.cursor.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, self.hash_password(password)))
-            self.conn.commit()
+            conn.execute("INSERT INTO users (username, password) VALUES (?, ?)", (username, cls.hash_password(password)))
             return True, "Registration Successful!"
         except sqlite3.IntegrityError:
             return False, "Username already exists!"
 
+    @classmethod
+    def _login(cls, conn, username, password):
+        record = conn.execute("SELECT password FROM users WHERE username = ?", (username,)).fetchone()
+        return (True, "Login Successful!") if record and record[0] == cls.hash_password(password) else (False, "Invalid Credentials!")
+
+    def signup_user(self, username, password):
+        result = self._signup(self.conn, username, password)
+        self.conn.commit()
+        return result
+
     def login_user(self, username, password):
-        self.cursor.execute("SELECT password FROM users WHERE username = ?", (username,))
-        record = self.cursor.fetchone()
-        return (True, "Login Successful!") if record and record[0] == self.hash_password(password) else (False, "Invalid Credentials!")
+        return self._login(self.conn, username, password)
+
+    def signup_user_async(self, username, password):
+        """Register on the writer thread; the Future resolves to (success, message)."""
+        return self.writer.call(self._signup, username, password)
+
+    def login_user_async(self, username, password):
+        """Check credentials, password hashing included, on the writer thread; the Future resolves to (success, message)."""
+        return self.writer.call(self._login, username, password)
 
     def update_score(self, username, score):
-        self.cursor.execute("SELECT highest_score FROM users WHERE username = ?", (username,))
-        current_score = self.cursor.fetchone()
-        if current_score and score > current_score[0]:
-            self.cursor.execute("UPDATE users SET highest_score = ? WHERE username = ?", (score, username))
-            self.conn.commit()
-            # print(f"Updated {username} highest score to {score}")
-
-    def get_top_players(self):
-        self.cursor.execute("SELECT username, highest_score FROM users ORDER BY highest_score DESC LIMIT 5")
+        """Queue a new highest score; the writer only applies it if it beats the stored one."""
+        self.writer.submit("UPDATE users SET highest_score = ? WHERE username = ? AND highest_score < ?", (score, username, score))
+        self.leaderboard.record(username, score)
+
+    def get_top_players(self, limit=5):
+        self.cursor.execute("SELECT username, highest_score FROM users ORDER BY highest_score DESC LIMIT ?", (limit,))
         return self.cursor.fetchall()
 
     def get_top_players_with_stats(self):
         self.cursor.execute("""
-            SELECT u.username, u.highest_score, AVG(gs.lives_lost) as avg_lives_lost
+            SELECT u.username, u.highest_score, CAST(s.total_lives_lost AS REAL) / s.sessions as avg_lives_lost
             FROM users u
-            LEFT JOIN game_sessions gs ON u.id = gs.user_id
-            GROUP BY u.id, u.username, u.highest_score
+            LEFT JOIN user_stats s ON u.id = s.user_id
             ORDER BY u.highest_score DESC
             LIMIT 5
         """)
         return self.cursor.fetchall()
 
-    def log_game_session(self, user_id, score, lives_lost):
-        """Log a game session with user_id, score, timestamp, and lives lost."""
-        import time  
-        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")  
-        self.cursor.execute("INSERT INTO game_sessions (user_id, score, timestamp, lives_lost) VALUES (?, ?, ?, ?)",
-                            (user_id, score, timestamp, lives_lost))
-        self.conn.commit()
-        # print(f"Logged session user_id {user_id}: score={score}, lives_lost={lives_lost}, timestamp={timestamp}")
+    def log_game_session(self, username, score, lives_lost):
+        """Queue a game session with score, timestamp, and lives lost, and fold it into user_stats.
+
+        Unknown usernames log nothing.
+        """
+        timestamp = time.strftime("%Y-%m-%d %H:%M:%S")
+        self.writer.submit_all([
+            (INSERT_GAME_SESSION, (score, timestamp, lives_lost, username)),
+            (UPSERT_USER_STATS, (lives_lost, score, score, timestamp, username)),
+        ])
+        # print(f"Logged session for {username}: score={score}, lives_lost={lives_lost}, timestamp={timestamp}")
+
+    def get_user_stats(self, user_id):
+        """Return (sessions, total lives lost, best score, average score, last played), or None."""
+        self.cursor.execute("""
+            SELECT sessions, total_lives_lost, best_score, CAST(total_score AS REAL) / sessions, last_played
+            FROM user_stats WHERE user_id = ?
+        """, (user_id,))
+        return self.cursor.fetchone()
 
     def get_user_id(self, username):
         """Get user ID from username."""
@@ -104,4 +326,6 @@ class Database:
         return result[0] if result else None
 
     def close(self):
+        """Flush queued writes, then close both connections."""
+        self.writer.close()
         self.conn.close()
\ No newline at end of file
@@ -0,0 +1,135 @@
+"""Enemy update cost and equivalence: every enemy updated every tick vs. EnemyActivation.
+
+Both sides run the same enemy classes on the same level while a stand-in
+player sweeps back and forth across it, teleporting every so often. After the
+run every tracked and unspawned enemy is caught up and the two sets of enemy
+states are compared exactly. Any difference is printed and the exit status
+is 1.
+
+Run from the repository root:  python -m benchmarks.activation_bench [--ticks N] [--levels 1 2 ...]
+"""
+import argparse
+import math
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import settings
+from game.activation import EnemyActivation
+from game.enemy import ENEMY_TYPES
+from game.level import Level
+from game.particle import ParticleSystem
+from game.projectile import ProjectilePool
+
+
+class Arena:
+    """The parts of Game enemies touch. Hits are ignored so the player stays on its path."""
+
+    def __init__(self):
+        self.particles = ParticleSystem()
+        self.projectiles = ProjectilePool()
+
+    def take_damage(self, player):
+        pass
+
+
+class Sweeper:
+    def __init__(self):
+        self.rect = pygame.Rect(0, 0, 32, 32)
+        self.velocity = pygame.Vector2()
+
+
+def enemy_state(enemy):
+    return (
+        type(enemy).__name__, enemy.patrol_state(), enemy.current_animation, enemy.frame_index,
+        enemy.animation_timer, enemy.animation_ticks, getattr(enemy, "attack_timer", None),
+        getattr(enemy, "shoot_timer", None), getattr(enemy, "shooting", None), len(getattr(enemy, "projectiles", ())),
+    )
+
+
+def run_level(level_number, ticks):
+    level = Level(f"levels/level{level_number}.json")
+    width, height = settings.screen_width, settings.screen_height
+    baseline_game, activation_game = Arena(), Arena()
+    baseline_player, activation_player = Sweeper(), Sweeper()
+    baseline = [ENEMY_TYPES[enemy_type](rect.x, rect.y, level, baseline_game) for rect, enemy_type in level.enemies if enemy_type in ENEMY_TYPES]
+    enemies = EnemyActivation(level, activation_game)
+
+    baseline_time = activation_time = 0.0
+    full = 0
+    for tick in range(1, ticks + 1):
+        x = int((math.sin(tick / 700) * 0.5 + 0.5) * (level.width - 32))
+        y = int((math.cos(tick / 900) * 0.5 + 0.5) * (level.height - 32))
+        if tick % 1500 == 0:
+            x, y = 480, 400
+        baseline_player.rect.topleft = activation_player.rect.topleft = (x, y)
+        view = pygame.Rect(max(0, x - width // 2), max(0, y - height // 2), width, height)
+
+        start = time.perf_counter()
+        for enemy in baseline:
+            enemy.update(level, baseline_player)
+        middle = time.perf_counter()
+        for enemy in enemies.update(view, activation_player):
+            enemy.update(level, activation_player)
+        activation_time += time.perf_counter() - middle
+        baseline_time += middle - start
+        full += enemies.full
+
+    # Bring everything the activation skipped or never spawned up to the same tick
+    for spawn in list(enemies.pending):
+        enemies.pending.remove(spawn)
+        enemies.spawn(*spawn)
+    for enemy in enemies:
+        if enemy in enemies.tracks:
+            enemies.catch_up(enemy, enemies.tick)
+
+    expected = sorted(map(enemy_state, baseline), key=repr)
+    actual = sorted(map(enemy_state, enemies), key=repr)
+    mismatches = [(a, b) for a, b in zip(expected, actual) if a != b]
+    if len(expected) != len(actual):
+        mismatches.append((len(expected), len(actual)))
+    return {
+        "level": level_number,
+        "enemies": len(baseline),
+        "full": full / ticks,
+        "baseline_us": baseline_time / ticks * 1e6,
+        "activation_us": activation_time / ticks * 1e6,
+        "shots": (baseline_game.projectiles.created, activation_game.projectiles.created),
+        "mismatches": mismatches,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--ticks", type=int, default=6000)
+    parser.add_argument("--levels", type=int, nargs="*", default=[1, 2, 3, 4, 5])
+    args = parser.parse_args()
+
+    pygame.init()
+    pygame.display.set_mode((settings.screen_width, settings.screen_height))
+
+    print(f"{'level':>5} {'enemies':>8} {'full/tick':>10} {'all us':>8} {'active us':>10} {'shots':>7} {'mismatched':>11}")
+    failed = False
+    for level_number in args.levels:
+        result = run_level(level_number, args.ticks)
+        shots = f"{result['shots'][0]}/{result['shots'][1]}"
+        print(f"{level_number:>5} {result['enemies']:>8} {result['full']:>10.1f} {result['baseline_us']:>8.0f} "
+              f"{result['activation_us']:>10.0f} {shots:>7} {len(result['mismatches']):>11}")
+        for expected, actual in result["mismatches"]:
+            print(f"    expected {expected}\n    got      {actual}")
+        failed = failed or bool(result["mismatches"]) or result["shots"][0] != result["shots"][1]
+
+    pygame.quit()
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,73 @@
+"""Per-frame collision cost: linear tile scan vs. the level's spatial hash.
+
+Run from the repository root:  python -m benchmarks.collision_bench
+"""
+import json
+import os
+import random
+import sys
+import tempfile
+import time
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from game.level import Level
+
+MOVERS = 13  # one player plus a typical level's worth of enemies
+FRAMES = 200
+
+
+def build_level(tile_count, tile_size=32):
+    columns = max(1, tile_count // 8)
+    tiles = []
+    for i in range(tile_count):
+        x = (i % columns) * tile_size
+        y = 256 + (i // columns) * tile_size * 3
+        tiles.append([x, y, tile_size, tile_size, 0])
+    handle, path = tempfile.mkstemp(suffix=".json")
+    with os.fdopen(handle, "w") as f:
+        json.dump({"tiles": tiles}, f)
+    try:
+        return Level(path)
+    finally:
+        os.remove(path)
+
+
+def frame_rects(level, rng):
+    return [pygame.Rect(rng.randrange(0, level.width), rng.randrange(0, level.height), 32, 32) for _ in range(MOVERS)]
+
+
+def linear(tiles, rect):
+    return [tile for tile in tiles if rect.colliderect(tile)]
+
+
+def run(tile_count):
+    level = build_level(tile_count)
+    tiles = [t[0] for t in level.physics_tiles]
+    rng = random.Random(tile_count)
+    frames = [frame_rects(level, rng) for _ in range(FRAMES)]
+
+    results = {}
+    for name, probe in (("linear", lambda r: linear(tiles, r)), ("spatial", level.query)):
+        start = time.perf_counter()
+        for rects in frames:
+            for rect in rects:
+                # horizontal pass, vertical pass and ground probe, as in Player.move/on_ground
+                probe(rect)
+                probe(rect.move(0, 4))
+                probe(rect.move(0, 2))
+        results[name] = (time.perf_counter() - start) / FRAMES * 1e6
+    return results
+
+
+def main():
+    print(f"{'tiles':>8} {'linear us/frame':>16} {'spatial us/frame':>17}")
+    for tile_count in (250, 500, 1000, 2000, 4000, 8000):
+        results = run(tile_count)
+        print(f"{tile_count:>8} {results['linear']:>16.1f} {results['spatial']:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""Flips per frame and draw cost: runtime pygame.transform.flip vs. the sprite atlas.
+
+Run from the repository root:  python -m benchmarks.flip_bench
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FRAMES = 600
+PLAYER_FRAMES = [os.path.join("Assets", "Player", "Player-Run", f"Run-0{i}.png") for i in range(1, 9)]
+
+
+def main():
+    pygame.init()
+    screen = pygame.display.set_mode((960, 540))
+    from game.assets import assets
+
+    atlas = assets.atlas({"run": PLAYER_FRAMES})
+    frames = atlas["run"]
+
+    print(f"{'entities':>9} {'flips/frame before':>19} {'flips/frame after':>18} {'before us/frame':>16} {'after us/frame':>15}")
+    for entities in (1, 13, 50, 200):
+        # Half the entities face left, the case that used to flip on every draw
+        facing = [i % 2 == 0 for i in range(entities)]
+        flips = sum(1 for right in facing if not right)
+
+        start = time.perf_counter()
+        for tick in range(FRAMES):
+            index = tick % len(frames)
+            for right in facing:
+                frame = frames[index]
+                if not right:
+                    frame = pygame.transform.flip(frame, True, False)
+                screen.blit(frame, (100, 100))
+        before = (time.perf_counter() - start) / FRAMES * 1e6
+
+        start = time.perf_counter()
+        for tick in range(FRAMES):
+            index = tick % len(frames)
+            for right in facing:
+                screen.blit(atlas.frame("run", index, flipped=not right), (100, 100))
+        after = (time.perf_counter() - start) / FRAMES * 1e6
+
+        print(f"{entities:>9} {flips:>19} {0:>18} {before:>16.1f} {after:>15.1f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
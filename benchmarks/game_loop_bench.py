@@ -0,0 +1,139 @@
+"""Headless game-loop benchmark over every shipped level.
+
+Runs game_screen under SDL's dummy video and audio drivers with scripted
+input, one simulation tick per frame and no frame-rate cap, and prints a
+JSON report of tick throughput, frame-time percentiles and update / draw /
+present cost per level.
+
+Run from the repository root:  python -m benchmarks.game_loop_bench [--frames N] [--levels 1 2 ...]
+"""
+import argparse
+import json
+import os
+import random
+import sys
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+os.environ.setdefault("SDL_AUDIODRIVER", "dummy")
+os.environ.setdefault("PYGAME_HIDE_SUPPORT_PROMPT", "1")
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config.settings import Settings
+from game.profiler import Profiler, percentile
+
+
+class ScriptedKeys:
+    def __init__(self, held):
+        self.held = held
+
+    def __getitem__(self, key):
+        return key in self.held
+
+
+class ScriptedInput:
+    """Runs right and left in long strides, jumping and dashing on a fixed schedule, then quits.
+
+    Only frames the profiler records count toward the total, so frames spent on
+    the loading screen don't eat into the level's.
+    """
+
+    def __init__(self, frames, profiler):
+        self.frames = frames
+        self.profiler = profiler
+        self.tick = 0
+
+    def events(self):
+        # Keep SDL's queue drained like the real loop does
+        pygame.event.pump()
+        if len(self.profiler.frames) >= self.frames:
+            return [pygame.event.Event(pygame.QUIT)]
+        return []
+
+    def pressed(self):
+        self.tick += 1
+        held = {pygame.K_RIGHT if (self.tick // 240) % 2 == 0 else pygame.K_LEFT}
+        if self.tick % 45 == 0:
+            held.add(pygame.K_UP)
+        if self.tick % 150 == 10:
+            held.add(pygame.K_SPACE)
+        return ScriptedKeys(held)
+
+
+class SteppedClock:
+    """Reports exactly one simulation tick per frame and never sleeps."""
+
+    def __init__(self, tick_rate):
+        self.step_ms = 1000 / tick_rate
+
+    def tick(self, framerate=0):
+        return self.step_ms
+
+
+def run_level(screen, level_number, frames):
+    from screens.game_screen import game_screen
+
+    settings = Settings()
+    # The scripted run never dodges; with a life per frame it can't reach the game-over
+    # screen, which would use up the remaining frames and be reported as the level's
+    settings.starting_lives = frames + 1
+    profiler = Profiler(enabled=True, history=frames + 1)
+    controls = ScriptedInput(frames, profiler)
+    random.seed(level_number)
+
+    game_screen(screen, settings, None, None, level_number=level_number,
+                controls=controls, clock=SteppedClock(settings.tick_rate), profiler=profiler)
+
+    frame_ms = [t * 1000 for t in profiler.samples("frame")]
+    mean = lambda values: sum(values) / len(values) if values else 0.0
+    return {
+        "level": level_number,
+        "frames": len(frame_ms),
+        "complete": len(frame_ms) >= frames,
+        "ticks_per_s": round(len(frame_ms) / (sum(frame_ms) / 1000), 1) if frame_ms else 0.0,
+        "frame_ms": {
+            "p50": round(percentile(frame_ms, 50), 3),
+            "p95": round(percentile(frame_ms, 95), 3),
+            "p99": round(percentile(frame_ms, 99), 3),
+            "max": round(max(frame_ms, default=0.0), 3),
+        },
+        "update_ms": round(mean(profiler.samples("update")) * 1000, 3),
+        "draw_ms": round((mean(profiler.samples("world")) + mean(profiler.samples("hud"))) * 1000, 3),
+        "present_ms": round(mean(profiler.samples("present")) * 1000, 3),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--frames", type=int, default=1200)
+    parser.add_argument("--levels", type=int, nargs="*", default=[1, 2, 3, 4, 5])
+    args = parser.parse_args()
+
+    pygame.init()
+    settings = Settings()
+    screen = pygame.display.set_mode((settings.screen_width, settings.screen_height))
+
+    # game_screen logs gameplay events to stdout; keep the report the only output there
+    stdout = sys.stdout
+    results = []
+    for level_number in args.levels:
+        sys.stdout = open(os.devnull, "w")
+        try:
+            results.append(run_level(screen, level_number, args.frames))
+        finally:
+            sys.stdout.close()
+            sys.stdout = stdout
+
+    pygame.quit()
+    print(json.dumps({"pygame": pygame.version.ver, "levels": results}, indent=2))
+    short = [result["level"] for result in results if not result["complete"]]
+    if short:
+        print(f"Levels {short} ended before {args.frames} frames; their numbers are not comparable", file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
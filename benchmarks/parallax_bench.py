@@ -0,0 +1,67 @@
+"""Background fill rate and draw cost: per-tile layer blits vs. the parallax strips.
+
+Run from the repository root:  python -m benchmarks.parallax_bench
+"""
+import os
+import sys
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+FRAMES = 600
+
+
+def main():
+    pygame.init()
+    from config.settings import settings
+    from game.assets import assets
+    from game.parallax import ParallaxRenderer
+
+    screen_width, screen_height = settings.screen_width, settings.screen_height
+    screen = pygame.display.set_mode((screen_width, screen_height))
+    layers = [(assets.image(bg["file"], alpha=False, size=(screen_width, 1080)), bg["speed"]) for bg in settings.background_layers]
+    parallax = ParallaxRenderer(layers, screen_width, screen_height, settings.background_color)
+    offsets = [(tick * 7, (tick * 3) % 1200) for tick in range(FRAMES)]
+
+    # The loop game_screen ran before: a clear, then every tile of every layer
+    blits = 0
+    pixels = 0
+    screen_rect = screen.get_rect()
+    start = time.perf_counter()
+    for offset_x, offset_y in offsets:
+        screen.fill(settings.background_color)
+        pixels += screen_width * screen_height
+        for bg, speed in layers:
+            width, height = bg.get_size()
+            start_x = -((offset_x * speed) % width)
+            start_y = -((offset_y * speed) % height) - (height - screen_height) // 2
+            for j in range(int(screen_width / width) + 2):
+                for k in range(int(screen_height / height) + 2):
+                    drawn = screen.blit(bg, (start_x + j * width, start_y + k * height)).clip(screen_rect)
+                    pixels += drawn.width * drawn.height
+                    blits += 1
+    before = (time.perf_counter() - start) / FRAMES * 1000
+    before_pixels = pixels // FRAMES
+    before_blits = blits // FRAMES
+
+    pixels = 0
+    start = time.perf_counter()
+    for offset in offsets:
+        parallax.draw(screen, offset)
+        pixels += parallax.pixels
+    after = (time.perf_counter() - start) / FRAMES * 1000
+
+    print(f"layers {len(layers)}, strips {len(parallax.strips)}, clear {'yes' if parallax.needs_fill else 'skipped'}")
+    print(f"{'':>8} {'blits/frame':>12} {'pixels/frame':>13} {'ms/frame':>9}")
+    print(f"{'before':>8} {before_blits:>12} {before_pixels:>13} {before:>9.3f}")
+    print(f"{'after':>8} {'<=' + str(len(parallax.strips) * 2):>12} {pixels // FRAMES:>13} {after:>9.3f}")
+
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,76 @@
+"""Leaderboard stats query cost as game_sessions grows: live JOIN + AVG vs. user_stats.
+
+Grows one scratch database to a million sessions, backfilling user_stats at
+each size the way Database.migrate() does on an existing install, and times
+both forms of the top-players-with-stats query.
+
+Run from the repository root:  python -m benchmarks.stats_bench
+"""
+import os
+import random
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from auth.auth import Database
+
+USERS = 200
+REPEATS = 5
+
+# The query get_top_players_with_stats ran before user_stats existed
+JOIN_QUERY = """
+    SELECT u.username, u.highest_score, AVG(gs.lives_lost) as avg_lives_lost
+    FROM users u
+    LEFT JOIN game_sessions gs ON u.id = gs.user_id
+    GROUP BY u.id, u.username, u.highest_score
+    ORDER BY u.highest_score DESC
+    LIMIT 5
+"""
+
+
+def add_sessions(db, count, rng):
+    rows = [(rng.randrange(1, USERS + 1), rng.randrange(0, 2000), "2025-01-01 00:00:00", rng.randrange(0, 4)) for _ in range(count)]
+    with db.conn:
+        db.conn.executemany("INSERT INTO game_sessions (user_id, score, timestamp, lives_lost) VALUES (?, ?, ?, ?)", rows)
+
+
+def time_ms(query):
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        query()
+    return (time.perf_counter() - start) / REPEATS * 1000
+
+
+def main():
+    rng = random.Random(0)
+    directory = tempfile.mkdtemp()
+    db = Database(os.path.join(directory, "stats.db"))
+    with db.conn:
+        db.conn.executemany("INSERT INTO users (username, password, highest_score) VALUES (?, '', ?)",
+                            [(f"player{i}", rng.randrange(0, 5000)) for i in range(USERS)])
+
+    print(f"{'sessions':>10} {'backfill ms':>12} {'join+avg ms':>12} {'user_stats ms':>14}")
+    total = 0
+    for size in (10_000, 100_000, 1_000_000):
+        add_sessions(db, size - total, rng)
+        total = size
+
+        start = time.perf_counter()
+        db.conn.execute("PRAGMA user_version = 0")
+        db.migrate()
+        backfill = (time.perf_counter() - start) * 1000
+
+        join = time_ms(lambda: db.conn.execute(JOIN_QUERY).fetchall())
+        stats = time_ms(db.get_top_players_with_stats)
+        print(f"{size:>10} {backfill:>12.1f} {join:>12.3f} {stats:>14.3f}")
+
+    db.close()
+    for name in os.listdir(directory):
+        os.remove(os.path.join(directory, name))
+    os.rmdir(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -7,11 +7,32 @@ class Settings:
         self.screen_width = 960
         self.screen_height = 540
         self.fps = 60
+        self.tick_rate = 60
+        self.max_catchup_steps = 5
+        # How long login / signup show their success message before moving on
+        self.auth_success_hold_ms = 1000
+        # ... and how long they wait on the database before giving up
+        self.auth_timeout_ms = 5000
+        # Menu screens with nothing animating block on input for up to this long per frame
+        self.idle_wait_ms = 1000
+
+        # Profiling (F3 overlay, F4 cProfile capture, F5 trace export)
+        self.profiler_history = 120
+        self.profile_capture_frames = 120
+        # main.py --startup-profile fails when time to first frame exceeds this
+        self.startup_budget_ms = 1000
 
         # Level settings
         self.level_width = 4000
         self.level_height = 1200
         self.tile_size = 32
+        self.collision_cell_size = 128
+        # Memoized line-of-sight results kept per level before the memo is reset
+        self.los_cache_size = 4096
+        self.tile_chunk_size = 512
+        self.max_tile_chunks = 24
+        # Start building the next level once this share of collectibles is picked up
+        self.prefetch_collected_fraction = 0.75
 
         # Object properties
         self.player_size = (32, 32)
@@ -21,6 +42,8 @@ class Settings:
         self.particle_color = (255, 255, 255)
         self.background_color = (135, 206, 235)
         self.text_color = (255, 255, 255)
+        # Rendered text surfaces kept by the shared text cache
+        self.text_cache_size = 128
         self.game_over_color = (255, 0, 0)
 
         # Physics settings
@@ -29,11 +52,20 @@ class Settings:
         self.player_jump_power = -11
         self.enemy_speed = 1
 
+        # Enemy activation: full updates near the view, patrol jumps in the band
+        # beyond it, asleep (or not yet spawned) past that
+        self.enemy_active_margin = 128
+        self.enemy_patrol_margin = 960
+        self.enemy_patrol_interval = 10
+        # Ticks of patrol_step() to look for a repeating state before giving up
+        self.enemy_patrol_limit = 4000
+
         # Game mechanics
         self.starting_lives = 3
         self.damage_amount = 10
         self.attack_cooldown = 60
         self.particle_lifetime = 20
+        self.max_particles = 4096
         self.score_per_enemy = 10
         self.score_per_collectible = 5
         self.shoot_cooldown = 90
@@ -67,4 +99,22 @@ class Settings:
             "music": os.path.join("Assets", "Audio", "Sound", "music.wav"),
             "shoot": os.path.join("Assets", "Audio", "Sound", "shoot.wav"),
             "level_complete": os.path.join("Assets", "Audio", "Sound", "level-complete.mp3")
-        }
\ No newline at end of file
+        }
+        # Played through pygame.mixer.music straight from disk instead of being decoded
+        self.streamed_audio = ("music",)
+        self.audio_channels = 8
+        # Positional sounds fade out over this many pixels beyond the view and are culled past it
+        self.audible_distance = 600
+        # Effect name: (priority, minimum ticks between plays, simultaneous voice cap)
+        self.sound_rules = {
+            "level_complete": (5, 120, 1),
+            "hurt": (4, 10, 1),
+            "enemy_death": (3, 4, 2),
+            "jump": (2, 8, 1),
+            "dash": (2, 8, 1),
+            "coin": (2, 3, 2),
+            "shoot": (1, 6, 3)
+        }
+
+# Shared by every module; build one Settings per process
+settings = Settings()
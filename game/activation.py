@@ -0,0 +1,179 @@
+import pygame
+from game.enemy import ENEMY_TYPES
+from config.settings import settings
+
+class PatrolCycle:
+    """The path an undisturbed enemy walks from one starting state.
+
+    Recorded by running patrol_step() until a state repeats, which gives a
+    lead-in (dropping onto the platform, say) followed by a loop. The level
+    geometry never changes, so the state any number of ticks on is a lookup.
+    bounds covers every rect along the path.
+    """
+
+    def __init__(self, states, index, loop_start, size):
+        self.states = states
+        self.index = index
+        self.loop_start = loop_start
+        width, height = size
+        left = min(state[0] for state in states)
+        top = min(state[1] for state in states)
+        right = max(state[0] for state in states) + width
+        bottom = max(state[1] for state in states) + height
+        self.bounds = pygame.Rect(left, top, right - left, bottom - top)
+
+    @classmethod
+    def record(cls, enemy, limit):
+        """Return the cycle starting from enemy's current state, which is left as it was.
+
+        None if no state repeats within limit ticks, such as for an enemy that
+        keeps falling.
+        """
+        start = enemy.patrol_state()
+        states = []
+        index = {}
+        state = start
+        while state not in index and len(states) < limit:
+            index[state] = len(states)
+            states.append(state)
+            enemy.patrol_step()
+            state = enemy.patrol_state()
+        enemy.set_patrol_state(start)
+        if state not in index:
+            return None
+        return cls(states, index, index[state], enemy.rect.size)
+
+    def state(self, step):
+        """The state after step patrol_step() calls from the start."""
+        if step < len(self.states):
+            return self.states[step]
+        loop = len(self.states) - self.loop_start
+        return self.states[self.loop_start + (step - self.loop_start) % loop]
+
+class EnemyActivation:
+    """A level's enemies, simulated in detail only near the camera.
+
+    Enemies within settings.enemy_active_margin of the view get the full
+    update() every tick. Out to settings.enemy_patrol_margin they are moved
+    along their PatrolCycle every settings.enemy_patrol_interval ticks, and
+    beyond that they sleep, or have not been created yet. Patrol paths only
+    depend on the level, so an enemy moved along its cycle ends up exactly
+    where per-tick updates would have put it. Anything that is not plainly
+    patrolling, is within engage_range of the player, or never settles into
+    a loop is always updated in full.
+    """
+
+    def __init__(self, level, game=None):
+        self.level = level
+        self.game = game
+        # (spawn index, rect, type) of enemies not created yet
+        self.pending = [(index, rect, enemy_type) for index, (rect, enemy_type) in enumerate(level.enemies) if enemy_type in ENEMY_TYPES]
+        self.enemies = []
+        self.cycles = {}
+        # Enemy -> tick before which it is not worth trying to record a cycle again
+        self.unsettled = {}
+        # Enemy -> (cycle, step, tick): it was at that cycle step after tick updates
+        self.tracks = {}
+        self.tick = 0
+        self.full = 0
+        self.coarse = 0
+        self.asleep = 0
+        # Recording a cycle takes a few ms per enemy; do it here, on whatever thread
+        # builds the level, rather than mid-game on first approach. The cycles are
+        # cached with the level, so a restart or reload of it skips this.
+        cycles = level.patrol_cycles
+        for index, rect, enemy_type in self.pending:
+            if index not in cycles:
+                scout = ENEMY_TYPES[enemy_type](rect.x, rect.y, level)
+                cycles[index] = PatrolCycle.record(scout, settings.enemy_patrol_limit)
+
+    def __iter__(self):
+        return iter(self.enemies)
+
+    def remove(self, enemy):
+        self.enemies.remove(enemy)
+        self.tracks.pop(enemy, None)
+        self.cycles.pop(enemy, None)
+        self.unsettled.pop(enemy, None)
+
+    def update(self, view, player):
+        """Start the next tick and return the enemies to update() this tick.
+
+        Those enemies are caught up to the end of the previous tick first.
+        """
+        self.tick += 1
+        tick = self.tick
+        near = view.inflate(settings.enemy_active_margin * 2, settings.enemy_active_margin * 2)
+        far = view.inflate(settings.enemy_patrol_margin * 2, settings.enemy_patrol_margin * 2)
+
+        if self.pending:
+            for spawn in [spawn for spawn in self.pending if far.colliderect(spawn[1])]:
+                self.pending.remove(spawn)
+                self.spawn(*spawn)
+
+        active = []
+        self.coarse = self.asleep = 0
+        for enemy in self.enemies:
+            track = self.tracks.get(enemy)
+            if track is None:
+                track = self.track(enemy, near)
+                if track is None:
+                    active.append(enemy)
+                    continue
+            cycle, step, since = track
+            if not far.colliderect(cycle.bounds):
+                self.asleep += 1
+                continue
+            engaged = cycle.bounds.inflate(enemy.engage_range * 2, enemy.engage_range * 2).colliderect(player.rect)
+            if engaged or near.colliderect(cycle.bounds):
+                self.catch_up(enemy, tick - 1)
+                if engaged or near.colliderect(enemy.rect):
+                    del self.tracks[enemy]
+                    active.append(enemy)
+                    continue
+            if tick - self.tracks[enemy][2] >= settings.enemy_patrol_interval:
+                self.catch_up(enemy, tick)
+            self.coarse += 1
+        self.full = len(active)
+        return active
+
+    def spawn(self, index, rect, enemy_type):
+        enemy = ENEMY_TYPES[enemy_type](rect.x, rect.y, self.level, self.game)
+        self.enemies.append(enemy)
+        # A fresh spawn starts from the same state the cycle was recorded from
+        cycle = self.cycles[enemy] = self.level.patrol_cycles[index]
+        if cycle is not None:
+            # Where it would be had it been updated since the level started
+            self.tracks[enemy] = (cycle, 0, 0)
+
+    def track(self, enemy, near):
+        """Start moving a fully updated enemy along a cycle, if it is free to leave full updates."""
+        if not enemy.patrolling() or near.colliderect(enemy.rect):
+            return None
+        cycle = self.cycles.get(enemy)
+        state = enemy.patrol_state()
+        if cycle is None or state not in cycle.index:
+            if self.unsettled.get(enemy, 0) > self.tick:
+                return None
+            # Knocked off its usual path; record one from here instead
+            cycle = PatrolCycle.record(enemy, settings.enemy_patrol_limit)
+            if cycle is None:
+                self.unsettled[enemy] = self.tick + settings.enemy_patrol_limit
+                return None
+            self.cycles[enemy] = cycle
+        track = self.tracks[enemy] = (cycle, cycle.index[state], self.tick - 1)
+        return track
+
+    def catch_up(self, enemy, tick):
+        """Move a tracked enemy to where tick updates in total would have left it."""
+        cycle, step, since = self.tracks[enemy]
+        if tick <= since:
+            return
+        enemy.set_patrol_state(cycle.state(step + tick - since))
+        enemy.skip_ticks(tick - since)
+        enemy.previous_pos = enemy.rect.topleft
+        self.tracks[enemy] = (cycle, step + tick - since, tick)
+
+    def despawn(self):
+        for enemy in self.enemies:
+            enemy.despawn()
@@ -0,0 +1,188 @@
+import os
+from concurrent.futures import ThreadPoolExecutor
+import pygame
+from game.atlas import SpriteAtlas
+
+# AssetLoader order: what the first frame of play needs, then scenery, then audio
+PRIORITY_GAMEPLAY = 0
+PRIORITY_BACKGROUND = 1
+PRIORITY_DECOR = 2
+PRIORITY_AUDIO = 3
+
+class SilentSound:
+    """Stands in for a pygame Sound whose file isn't shipped."""
+
+    def play(self, *args, **kwargs):
+        return None
+
+    def stop(self):
+        pass
+
+    def set_volume(self, volume):
+        pass
+
+    def get_length(self):
+        return 0.0
+
+class AssetRegistry:
+    """Process-wide cache so every image and sound file is decoded once and shared."""
+
+    def __init__(self):
+        self.images = {}
+        self.sounds = {}
+        self.atlases = {}
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(path):
+        return os.path.normpath(path)
+
+    def image(self, path, alpha=True, size=None):
+        """Return the shared surface for path, converted for the display and optionally scaled."""
+        key = (self.key(path), alpha, tuple(size) if size else None)
+        surface = self.images.get(key)
+        if surface is not None:
+            self.hits += 1
+            return surface
+        self.misses += 1
+        if size:
+            surface = pygame.transform.scale(self.image(path, alpha), size)
+        else:
+            surface = pygame.image.load(path)
+            surface = surface.convert_alpha() if alpha else surface.convert()
+        self.images[key] = surface
+        return surface
+
+    def store_image(self, path, surface, alpha=True, size=None, scaled=None):
+        """Register a surface decoded off the main thread, converting it for the display here."""
+        key = (self.key(path), alpha, None)
+        if key not in self.images:
+            self.images[key] = surface.convert_alpha() if alpha else surface.convert()
+        if size and scaled is not None:
+            self.images[(key[0], alpha, tuple(size))] = scaled.convert_alpha() if alpha else scaled.convert()
+
+    def frames(self, paths, alpha=True, size=None):
+        return [self.image(path, alpha, size) for path in paths]
+
+    def solid(self, size, color):
+        """Return a shared surface filled with color, for drawing rects through blits."""
+        key = ("solid", tuple(size), tuple(color))
+        surface = self.images.get(key)
+        if surface is None:
+            surface = pygame.Surface(size).convert()
+            surface.fill(color)
+            self.images[key] = surface
+        return surface
+
+    def atlas(self, animations, alpha=True):
+        """Return the shared SpriteAtlas for a {name: [paths]} animation set."""
+        key = (tuple((name, tuple(self.key(p) for p in paths)) for name, paths in animations.items()), alpha)
+        atlas = self.atlases.get(key)
+        if atlas is not None:
+            self.hits += 1
+            return atlas
+        self.misses += 1
+        atlas = SpriteAtlas({name: self.frames(paths, alpha) for name, paths in animations.items()})
+        self.atlases[key] = atlas
+        return atlas
+
+    def sound(self, path):
+        key = self.key(path)
+        sound = self.sounds.get(key)
+        if sound is not None:
+            self.hits += 1
+            return sound
+        self.misses += 1
+        return self.store_sound(path, pygame.mixer.Sound(path) if os.path.exists(path) else None)
+
+    def store_sound(self, path, sound):
+        """Register a decoded sound; None means the file isn't shipped."""
+        if sound is None:
+            print(f"Sound file missing, playing silence instead: {path}")
+            sound = SilentSound()
+        self.sounds[self.key(path)] = sound
+        return sound
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "images": len(self.images), "atlases": len(self.atlases), "sounds": len(self.sounds)}
+
+class AssetLoader:
+    """Decodes queued image and sound files for a registry on a thread pool.
+
+    Workers only read, decode and scale files. pump() converts finished
+    surfaces for the display and registers them on the calling (main) thread,
+    strictly in priority order, so a loading screen can draw between calls.
+    """
+
+    def __init__(self, registry, workers=None):
+        self.registry = registry
+        self.workers = workers or min(4, os.cpu_count() or 1)
+        self.jobs = []
+        self.queued = set()
+        self.futures = []
+        self.executor = None
+        self.completed = 0
+
+    def add_image(self, path, alpha=True, size=None, priority=PRIORITY_GAMEPLAY):
+        key = (self.registry.key(path), alpha, tuple(size) if size else None)
+        if key in self.registry.images or key in self.queued:
+            return
+        self.queued.add(key)
+        self.jobs.append((priority, len(self.jobs), "image", path, alpha, size))
+
+    def add_images(self, paths, alpha=True, size=None, priority=PRIORITY_GAMEPLAY):
+        for path in paths:
+            self.add_image(path, alpha, size, priority)
+
+    def add_sounds(self, paths, priority=PRIORITY_AUDIO):
+        for path in paths:
+            key = self.registry.key(path)
+            if key in self.registry.sounds or key in self.queued:
+                continue
+            self.queued.add(key)
+            self.jobs.append((priority, len(self.jobs), "sound", path, None, None))
+
+    def start(self):
+        self.jobs.sort()
+        if self.jobs:
+            self.executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="asset-loader")
+            self.futures = [self.executor.submit(self._decode, job) for job in self.jobs]
+
+    @staticmethod
+    def _decode(job):
+        _, _, kind, path, alpha, size = job
+        if kind == "sound":
+            return pygame.mixer.Sound(path) if os.path.exists(path) else None
+        surface = pygame.image.load(path)
+        return surface, pygame.transform.scale(surface, size) if size else None
+
+    def pump(self):
+        """Register finished jobs up to the first one still decoding; returns progress from 0 to 1."""
+        while self.completed < len(self.futures) and self.futures[self.completed].done():
+            _, _, kind, path, alpha, size = self.jobs[self.completed]
+            result = self.futures[self.completed].result()
+            if kind == "sound":
+                self.registry.store_sound(path, result)
+            else:
+                self.registry.store_image(path, result[0], alpha, size, result[1])
+            self.completed += 1
+        if self.done and self.executor is not None:
+            self.executor.shutdown()
+            self.executor = None
+        return self.progress
+
+    @property
+    def progress(self):
+        return self.completed / len(self.futures) if self.futures else 1.0
+
+    @property
+    def done(self):
+        return self.completed >= len(self.futures)
+
+    def cancel(self):
+        if self.executor is not None:
+            self.executor.shutdown(wait=False, cancel_futures=True)
+            self.executor = None
+
+assets = AssetRegistry()
@@ -0,0 +1,35 @@
+import pygame
+
+class SpriteAtlas:
+    """Packs named animations into one surface with a mirrored copy of every frame.
+
+    Each animation gets two rows: the frames as drawn and the same frames flipped
+    horizontally. Frames are handed out as subsurfaces, so drawing a mirrored sprite
+    is a lookup instead of a pygame.transform.flip per draw.
+    """
+
+    def __init__(self, animations):
+        cell_width = max((f.get_width() for frames in animations.values() for f in frames), default=0)
+        cell_height = max((f.get_height() for frames in animations.values() for f in frames), default=0)
+        columns = max((len(frames) for frames in animations.values()), default=0)
+        self.surface = pygame.Surface((max(1, cell_width * columns), max(1, cell_height * len(animations) * 2)), pygame.SRCALPHA)
+        self.frames = {}
+        self.mirrored = {}
+
+        for row, (name, frames) in enumerate(animations.items()):
+            y = row * 2 * cell_height
+            self.frames[name] = []
+            self.mirrored[name] = []
+            for column, frame in enumerate(frames):
+                x = column * cell_width
+                size = frame.get_size()
+                self.surface.blit(frame, (x, y))
+                self.surface.blit(pygame.transform.flip(frame, True, False), (x, y + cell_height))
+                self.frames[name].append(self.surface.subsurface(pygame.Rect((x, y), size)))
+                self.mirrored[name].append(self.surface.subsurface(pygame.Rect((x, y + cell_height), size)))
+
+    def __getitem__(self, name):
+        return self.frames[name]
+
+    def frame(self, name, index, flipped=False):
+        return (self.mirrored if flipped else self.frames)[name][index]
@@ -0,0 +1,121 @@
+import os
+import pygame
+from game.assets import assets, SilentSound
+from config.settings import settings
+
+class SoundManager:
+    """Plays named sound effects within a fixed mixer channel budget.
+
+    Every effect has a rule in settings.sound_rules: a priority, a minimum
+    number of ticks between plays and a cap on simultaneous voices. Once the
+    cap or the channel budget is reached, a new sound takes over the oldest
+    voice of the same sound, or the lowest-priority voice ranked no higher
+    than itself. If there is none, the new sound is dropped. Positional sounds
+    are faded with distance from the view and culled beyond
+    settings.audible_distance. Channel 0 is reserved for the ambience loop.
+    Music is streamed from disk by pygame.mixer.music rather than decoded
+    into memory.
+    """
+
+    def __init__(self, channels=None):
+        self.channel_count = channels or settings.audio_channels
+        pygame.mixer.set_num_channels(self.channel_count)
+        pygame.mixer.set_reserved(1)
+        self.ambience_channel = pygame.mixer.Channel(0)
+        self.channels = [pygame.mixer.Channel(i) for i in range(1, self.channel_count)]
+        # Per channel: (sound name, priority, tick started) of what was last played on it
+        self.voices = [None] * len(self.channels)
+        self.last_played = {}
+        self.listener = None
+        self.tick = 0
+        self.played = 0
+        self.rate_limited = 0
+        self.stolen = 0
+        self.culled = 0
+        self.dropped = 0
+
+    def update(self, listener=None):
+        """Advance one simulation tick; listener is the rect sounds are heard from."""
+        self.tick += 1
+        if listener is not None:
+            self.listener = listener
+
+    def play(self, name, position=None):
+        priority, min_interval, max_voices = settings.sound_rules.get(name, (0, 0, 1))
+        last = self.last_played.get(name)
+        if last is not None and self.tick - last < min_interval:
+            self.rate_limited += 1
+            return None
+
+        volume = 1.0
+        if position is not None and self.listener is not None:
+            distance = self.distance_to_listener(position)
+            if distance > settings.audible_distance:
+                self.culled += 1
+                return None
+            volume = 1.0 - distance / settings.audible_distance
+
+        sound = assets.sound(settings.audio_files[name])
+        if isinstance(sound, SilentSound):
+            return None
+
+        index = self.pick_channel(name, priority, max_voices)
+        if index is None:
+            self.dropped += 1
+            return None
+        channel = self.channels[index]
+        channel.play(sound)
+        channel.set_volume(volume)
+        self.voices[index] = (name, priority, self.tick)
+        self.last_played[name] = self.tick
+        self.played += 1
+        return channel
+
+    def pick_channel(self, name, priority, max_voices):
+        """Return the index of the channel a new voice should use, or None to drop it."""
+        if not self.channels:
+            # A budget of one channel leaves only the ambience channel
+            return None
+        busy = [i for i, channel in enumerate(self.channels) if channel.get_busy()]
+        same = [i for i in busy if self.voices[i] and self.voices[i][0] == name]
+        if len(same) >= max_voices:
+            self.stolen += 1
+            return min(same, key=lambda i: self.voices[i][2])
+        if len(busy) < len(self.channels):
+            return next(i for i in range(len(self.channels)) if i not in busy)
+        # Channels started outside the manager rank lowest
+        victim = min(busy, key=lambda i: self.voices[i][1:] if self.voices[i] else (-1, -1))
+        if self.voices[victim] and self.voices[victim][1] > priority:
+            return None
+        self.stolen += 1
+        return victim
+
+    def distance_to_listener(self, position):
+        x, y = position
+        view = self.listener
+        dx = max(view.left - x, 0, x - view.right)
+        dy = max(view.top - y, 0, y - view.bottom)
+        return (dx * dx + dy * dy) ** 0.5
+
+    def play_ambience(self, name="ambience"):
+        sound = assets.sound(settings.audio_files[name])
+        if not isinstance(sound, SilentSound):
+            self.ambience_channel.play(sound, loops=-1)
+
+    def play_music(self, name="music"):
+        path = settings.audio_files[name]
+        if os.path.exists(path):
+            pygame.mixer.music.load(path)
+            pygame.mixer.music.play(-1)
+
+    def stop_background(self):
+        pygame.mixer.music.stop()
+        self.ambience_channel.stop()
+
+    def stop(self):
+        self.stop_background()
+        for channel in self.channels:
+            channel.stop()
+
+    def stats(self):
+        return {"played": self.played, "rate_limited": self.rate_limited, "stolen": self.stolen, "culled": self.culled, "dropped": self.dropped}
@@ -1,17 +1,21 @@
 import pygame
-from config.settings import Settings
-
-settings = Settings()
 
 class Camera:
     def __init__(self, level_width, level_height, screen_width, screen_height):
         self.offset = pygame.Vector2(0, 0)
+        # offset is the simulated position; drawing uses render_offset, which is
+        # interpolated between the previous and current tick
+        self.previous_offset = pygame.Vector2(0, 0)
+        self.render_offset = pygame.Vector2(0, 0)
         self.level_width = level_width
         self.level_height = level_height
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.follow_speed = 0.1
-        
+        self.drawn = 0
+        self.culled = 0
+        self.culled_total = 0
+
     def update(self, target):
         target_x = target.centerx - self.screen_width // 2
         target_y = target.centery - self.screen_height // 2
@@ -20,11 +24,34 @@ class Camera:
         self.offset.x = max(0, min(self.offset.x, self.level_width - self.screen_width))
         self.offset.y = max(0, min(self.offset.y, self.level_height - self.screen_height))
 
+    def snapshot(self):
+        self.previous_offset.update(self.offset)
+
+    def interpolate(self, alpha):
+        self.render_offset = self.previous_offset.lerp(self.offset, alpha)
+
     def apply(self, rect):
-        return rect.move(-self.offset.x, -self.offset.y)
+        return rect.move(-self.render_offset.x, -self.render_offset.y)
+
+    def view_rect(self, margin=1):
+        """World-space rect currently on screen, grown by margin pixels on every side."""
+        return pygame.Rect(
+            int(self.render_offset.x) - margin, int(self.render_offset.y) - margin,
+            self.screen_width + margin * 2, self.screen_height + margin * 2
+        )
+
+    def begin_frame(self):
+        """Reset the per-frame draw/cull counters."""
+        self.drawn = 0
+        self.culled = 0
+
+    def count_culled(self, visible, total):
+        """Record how many of total draw calls survived culling; returns visible unchanged."""
+        self.record_culling(len(visible), total)
+        return visible
 
-    def apply_parallax(self, layer_index):
-        """Apply parallax scrolling for background layers."""
-        layer_speed = settings.background_layers[layer_index]["speed"]
-        parallax_offset = pygame.Vector2(self.offset.x * layer_speed, self.offset.y * layer_speed)
-        return parallax_offset
\ No newline at end of file
+    def record_culling(self, drawn, total):
+        """Record that drawn of total objects were on screen this frame."""
+        self.drawn += drawn
+        self.culled += total - drawn
+        self.culled_total += total - drawn
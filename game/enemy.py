@@ -1,25 +1,31 @@
 import pygame
 import os
-from game.projectile import Projectile
-from config.settings import Settings
-
-settings = Settings()
+from game.assets import assets
+from game.render_queue import LAYER_ENTITIES
+from game.timestep import interpolate_rect
+from config.settings import settings
 
 class Enemy:
-    def __init__(self, x, y, tiles, game=None):
+    # How close the player has to be before update() reacts to them
+    engage_range = 0
+    
+    def __init__(self, x, y, level, game=None):
         self.rect = pygame.Rect(x, y, *settings.enemy_size)
         self.velocity = pygame.Vector2(-settings.enemy_speed, 0)
         self.gravity = settings.gravity
         self.speed = settings.enemy_speed
         self.game = game
-        self.tiles = tiles
-        self.snap_to_ground(tiles)
+        self.level = level
+        self.snap_to_ground(level)
+        self.previous_pos = self.rect.topleft
+        # animate() calls since the last frame change
+        self.animation_ticks = 0
     
-    def snap_to_ground(self, tiles):
+    def snap_to_ground(self, level):
         temp_rect = self.rect.copy()
         while temp_rect.y < settings.level_height:
             temp_rect.y += 1
-            for tile in tiles:
+            for tile in level.query(temp_rect):
                 if temp_rect.colliderect(tile):
                     self.rect.bottom = tile.top
                     return
@@ -27,13 +33,17 @@ class Enemy:
                 break
         self.rect.bottom = 500
     
+    def can_see(self, point):
+        """True if no physics tile lies between this enemy's centre and point."""
+        return self.level.line_of_sight(self.rect.center, point)
+    
     def apply_gravity(self):
         self.velocity.y += self.gravity
         self.velocity.y = min(self.velocity.y, 15)
     
     def move_horizontal(self):
         self.rect.x += self.velocity.x
-        for tile in self.tiles:
+        for tile in self.level.query(self.rect):
             if self.rect.colliderect(tile):
                 if self.velocity.x > 0:
                     self.rect.right = tile.left
@@ -45,7 +55,7 @@ class Enemy:
     def move_vertical(self):
         self.rect.y += self.velocity.y
         on_ground = False
-        for tile in self.tiles:
+        for tile in self.level.query(self.rect):
             if self.rect.colliderect(tile):
                 if self.velocity.y > 0:
                     self.rect.bottom = tile.top
@@ -56,79 +66,133 @@ class Enemy:
                     self.velocity.y = 0
         return on_ground
     
-    def update(self, tiles, player):
+    def edge_ahead(self):
+        """True if the floor ends just ahead in the direction of travel."""
+        probe = pygame.Rect(self.rect.x + (self.velocity.x * 10), self.rect.bottom, 10, 2)
+        return not self.level.query(probe)
+    
+    def patrol_step(self):
+        """Move one tick the way the enemy does when nothing draws it off its patrol."""
         pass
     
-    def draw(self, screen, camera):
+    def patrolling(self):
+        """True if update() would only patrol, tick timers and animate while the player is beyond engage_range."""
+        return True
+    
+    def patrol_state(self):
+        """Everything patrol_step() reads and writes, as a hashable tuple."""
+        return (self.rect.x, self.rect.y, self.velocity.x, self.velocity.y, self.facing_right)
+    
+    def set_patrol_state(self, state):
+        self.rect.x, self.rect.y, velocity_x, velocity_y, self.facing_right = state
+        self.velocity.update(velocity_x, velocity_y)
+    
+    def animate(self):
+        self.animation_timer += self.animation_speed
+        self.animation_ticks += 1
+        if self.animation_timer >= 1:
+            self.frame_index = (self.frame_index + 1) % len(self.animations[self.current_animation])
+            self.animation_timer = 0
+            self.animation_ticks = 0
+    
+    def skip_ticks(self, ticks):
+        """Advance timers and animation by ticks updates without simulating them."""
+        # The same float additions animate() makes, so the frame length and the
+        # timer left over match per-tick updates exactly
+        frame_ticks = 0
+        timer = 0
+        while timer < 1:
+            timer += self.animation_speed
+            frame_ticks += 1
+        frames, self.animation_ticks = divmod(self.animation_ticks + ticks, frame_ticks)
+        self.frame_index = (self.frame_index + frames) % len(self.animations[self.current_animation])
+        self.animation_timer = 0
+        for _ in range(self.animation_ticks):
+            self.animation_timer += self.animation_speed
+    
+    def snapshot(self):
+        """Remember where the enemy was before the next simulation tick."""
+        self.previous_pos = self.rect.topleft
+    
+    def render_rect(self, alpha):
+        return interpolate_rect(self.rect, self.previous_pos, alpha)
+    
+    def update(self, level, player):
+        pass
+    
+    def despawn(self):
+        """Hand back anything borrowed from shared pools before the enemy is dropped."""
+        pass
+    
+    def draw(self, queue, camera, alpha=1.0):
         pass
 
 class EnemyCrab(Enemy):
-    def __init__(self, x, y, tiles, game=None):
-        super().__init__(x, y, tiles, game)
+    ANIMATIONS = {
+        "idle": [os.path.join("Assets", "Enemies", "Crab", "Idle", f"crab-idle{i}.png") for i in range(1, 5)],
+        "walk": [os.path.join("Assets", "Enemies", "Crab", "Walk", f"crab-walk{i}.png") for i in range(1, 7)]
+    }
+
+    def __init__(self, x, y, level, game=None):
+        super().__init__(x, y, level, game)
         self.attack_cooldown = settings.attack_cooldown
         self.attack_timer = 0
         
-        self.animations = {
-            "idle": [pygame.image.load(os.path.join("Assets", "Enemies", "Crab", "Idle", f"crab-idle{i}.png")).convert_alpha() for i in range(1, 5)],
-            "walk": [pygame.image.load(os.path.join("Assets", "Enemies", "Crab", "Walk", f"crab-walk{i}.png")).convert_alpha() for i in range(1, 7)]
-        }
+        self.animations = assets.atlas(self.ANIMATIONS)
         self.current_animation = "walk"
         self.frame_index = 0
         self.animation_speed = 0.1
         self.animation_timer = 0
         self.facing_right = True
     
-    def update(self, tiles, player):
+    def patrol_step(self):
         self.apply_gravity()
         
         self.move_horizontal()
         
         on_ground = self.move_vertical()
         
-        if on_ground:
-            edge_ahead = pygame.Rect(
-                self.rect.x + (self.velocity.x * 10),
-                self.rect.bottom, 10, 2
-            )
-            if not any(edge_ahead.colliderect(tile) for tile in tiles):
-                self.velocity.x = -self.velocity.x
-                self.facing_right = not self.facing_right
+        if on_ground and self.edge_ahead():
+            self.velocity.x = -self.velocity.x
+            self.facing_right = not self.facing_right
+    
+    def update(self, level, player):
+        self.patrol_step()
         
         if self.attack_timer > 0:
             self.attack_timer -= 1
         
-        self.animation_timer += self.animation_speed
-        if self.animation_timer >= 1:
-            self.frame_index = (self.frame_index + 1) % len(self.animations[self.current_animation])
-            self.animation_timer = 0
+        self.animate()
+    
+    def skip_ticks(self, ticks):
+        super().skip_ticks(ticks)
+        self.attack_timer = max(self.attack_timer - ticks, 0)
     
     def attack(self, player):
         if self.attack_timer <= 0 and self.game:
             self.game.take_damage(player)
             self.attack_timer = self.attack_cooldown
     
-    def draw(self, screen, camera):
-        frame = self.animations[self.current_animation][self.frame_index]
-        if not self.facing_right:
-            frame = pygame.transform.flip(frame, True, False)
-        adjusted_rect = camera.apply(self.rect)
-        screen.blit(frame, adjusted_rect)
+    def draw(self, queue, camera, alpha=1.0):
+        frame = self.animations.frame(self.current_animation, self.frame_index, flipped=not self.facing_right)
+        queue.add(LAYER_ENTITIES, frame, camera.apply(self.render_rect(alpha)))
 
 class EnemyLizard(Enemy):
-    def __init__(self, x, y, tiles, game=None):
-        super().__init__(x, y, tiles, game)
+    ANIMATIONS = {
+        "move": [os.path.join("Assets", "Enemies", "Lizzard", "lizard moves", f"lizard-move{i}.png") for i in range(1, 4)],
+        "shoot": [os.path.join("Assets", "Enemies", "Lizzard", "lizard shoots", f"lizard-shoot{i}.png") for i in range(1, 5)]
+    }
+
+    def __init__(self, x, y, level, game=None):
+        super().__init__(x, y, level, game)
         self.shoot_cooldown = settings.shoot_cooldown
         self.shoot_timer = 0
         self.projectiles = []
-        self.particle_effects = []
         self.shooting = False
         self.shoot_duration = 30
         self.shoot_duration_timer = 0
         
-        self.animations = {
-            "move": [pygame.image.load(os.path.join("Assets", "Enemies", "Lizzard", "lizard moves", f"lizard-move{i}.png")).convert_alpha() for i in range(1, 4)],
-            "shoot": [pygame.image.load(os.path.join("Assets", "Enemies", "Lizzard", "lizard shoots", f"lizard-shoot{i}.png")).convert_alpha() for i in range(1, 5)]
-        }
+        self.animations = assets.atlas(self.ANIMATIONS)
         self.current_animation = "move"
         self.frame_index = 0
         self.animation_speed = 0.15
@@ -137,12 +201,8 @@ class EnemyLizard(Enemy):
         self.shoot_range = 400
         self.min_shoot_range = 100
     
-    def check_line_of_sight(self, tiles, player):
+    def check_line_of_sight(self, level, player):
         direction = 1 if self.facing_right else -1
-        start_x = self.rect.centerx
-        end_x = player.rect.centerx
-        step = direction * 10
-        current_x = start_x
         
         vertical_tolerance = 32
         if abs(player.rect.centery - self.rect.centery) > vertical_tolerance:
@@ -152,22 +212,34 @@ class EnemyLizard(Enemy):
            (direction < 0 and player.rect.centerx >= self.rect.centerx):
             return False
         
-        while (direction > 0 and current_x < end_x) or (direction < 0 and current_x > end_x):
-            check_point = pygame.Rect(current_x, self.rect.centery - 10, 10, 20)
-            for tile in tiles:
-                if check_point.colliderect(tile):
-                    return False
-            current_x += step
-        return True
+        return self.can_see(player.rect.center)
 
-    def update(self, tiles, player):
+    def patrol_step(self):
         self.apply_gravity()
         
+        self.move_horizontal()
+        self.facing_right = self.velocity.x > 0
+        
+        on_ground = self.move_vertical()
+        
+        if on_ground and self.edge_ahead():
+            self.velocity.x = -self.velocity.x
+            self.facing_right = self.velocity.x > 0
+    
+    @property
+    def engage_range(self):
+        return self.shoot_range
+    
+    def patrolling(self):
+        return not self.shooting and not self.projectiles
+    
+    def update(self, level, player):
         player_dx = player.rect.centerx - self.rect.centerx
         player_dy = player.rect.centery - self.rect.centery
         distance = (player_dx ** 2 + player_dy ** 2) ** 0.5
         
         if self.shooting:
+            self.apply_gravity()
             self.shoot_duration_timer -= 1
             if self.shoot_duration_timer <= 0:
                 self.shooting = False
@@ -181,65 +253,65 @@ class EnemyLizard(Enemy):
                     self.current_animation = "shoot"
                     self.frame_index = 0
                 self.facing_right = player_dx > 0
-        else:
-            self.move_horizontal()
-            self.facing_right = self.velocity.x > 0
-        
-        on_ground = self.move_vertical()
-        
-        if on_ground and not self.shooting:
-            edge_ahead = pygame.Rect(
-                self.rect.x + (self.velocity.x * 10),
-                self.rect.bottom, 10, 2
-            )
-            if not any(edge_ahead.colliderect(tile) for tile in tiles):
+            
+            on_ground = self.move_vertical()
+            
+            if on_ground and not self.shooting and self.edge_ahead():
                 self.velocity.x = -self.velocity.x
                 self.facing_right = self.velocity.x > 0
+        else:
+            self.patrol_step()
         
         if self.shoot_timer > 0:
             self.shoot_timer -= 1
         
-        if self.shoot_timer == 0 and not self.shooting:
-            if self.min_shoot_range < distance < self.shoot_range and self.check_line_of_sight(tiles, player):
+        if self.shoot_timer == 0 and not self.shooting and self.game:
+            if self.min_shoot_range < distance < self.shoot_range and self.check_line_of_sight(level, player):
                 direction = 1 if self.facing_right else -1
                 target_x = player.rect.centerx + (player.velocity.x * 10)
-                projectile = Projectile(self.rect.centerx, self.rect.centery, direction)
+                projectile = self.game.projectiles.acquire(self.rect.centerx, self.rect.centery, direction)
                 self.projectiles.append(projectile)
                 self.shoot_timer = self.shoot_cooldown
                 self.shooting = True
                 self.shoot_duration_timer = self.shoot_duration
         
         for proj in self.projectiles[:]:
-            proj.update(tiles)
+            proj.update(level)
             if proj.remove:
-                self.particle_effects.extend(proj.update_particles())
-                self.projectiles.remove(proj)
-        
-        remaining_particles = []
-        for particle, velocity, lifetime in self.particle_effects[:]:
-            particle.x += velocity.x
-            particle.y += velocity.y
-            lifetime -= 1
-            if lifetime > 0:
-                remaining_particles.append((particle, velocity, lifetime))
-        self.particle_effects = remaining_particles
+                proj.spawn_particles(self.game.particles)
+                self.release_projectile(proj)
         
-        self.animation_timer += self.animation_speed
-        if self.animation_timer >= 1:
-            self.frame_index = (self.frame_index + 1) % len(self.animations[self.current_animation])
-            self.animation_timer = 0
+        self.animate()
+    
+    def skip_ticks(self, ticks):
+        super().skip_ticks(ticks)
+        self.shoot_timer = max(self.shoot_timer - ticks, 0)
     
-    def draw_projectiles(self, screen, camera):
+    def release_projectile(self, proj):
+        self.projectiles.remove(proj)
+        self.game.projectiles.release(proj)
+    
+    def despawn(self):
+        for proj in self.projectiles[:]:
+            self.release_projectile(proj)
+
+    def snapshot(self):
+        super().snapshot()
         for proj in self.projectiles:
-            proj.draw(screen, camera)
+            proj.snapshot()
+
+    def draw_projectiles(self, queue, camera, alpha=1.0):
+        for proj in self.projectiles:
+            proj.draw(queue, camera, alpha)
+
+    def draw(self, queue, camera, alpha=1.0):
+        frame = self.animations.frame(self.current_animation, self.frame_index, flipped=self.facing_right)
+        queue.add(LAYER_ENTITIES, frame, camera.apply(self.render_rect(alpha)))
+
+# Level spawn type -> enemy class
+ENEMY_TYPES = {"walker": EnemyCrab, "shooter": EnemyLizard}
 
-    def draw(self, screen, camera):
-        frame = self.animations[self.current_animation][self.frame_index]
-        if self.facing_right:
-            frame = pygame.transform.flip(frame, True, False)
-        adjusted_rect = camera.apply(self.rect)
-        screen.blit(frame, adjusted_rect)
-        
-        for particle, _, _ in self.particle_effects:
-            adjusted_particle_rect = camera.apply(particle)
-            pygame.draw.rect(screen, settings.particle_color, adjusted_particle_rect)
\ No newline at end of file
+def preload_enemy_assets():
+    """Load every enemy atlas up front so spawning enemies never touches the disk."""
+    for enemy_class in ENEMY_TYPES.values():
+        assets.atlas(enemy_class.ANIMATIONS)
@@ -0,0 +1,49 @@
+import pygame
+from game.text import text_cache
+from config.settings import settings
+
+class Hud:
+    """The status bar along the top of the game screen.
+
+    It is composed onto one cached surface, which is only redrawn when one of
+    the values it shows changes.
+    """
+
+    def __init__(self, heart_full, heart_empty, width=None, height=70):
+        self.width = width or settings.screen_width
+        self.surface = pygame.Surface((self.width, height), pygame.SRCALPHA)
+        self.heart_full = heart_full
+        self.heart_empty = heart_empty
+        self.font = text_cache.font(None, 36)
+        self.small_font = text_cache.font(None, 24)
+        self.state = None
+        self.redraws = 0
+
+    def update(self, level_number, score, lives, dash_status, shield_status):
+        """Return the HUD surface, redrawing it first if anything shown has changed."""
+        state = (level_number, score, lives, dash_status, shield_status)
+        if state != self.state:
+            self.state = state
+            self.redraw(*state)
+        return self.surface
+
+    def redraw(self, level_number, score, lives, dash_status, shield_status):
+        self.redraws += 1
+        surface = self.surface
+        surface.fill((0, 0, 0, 0))
+        color = settings.text_color
+
+        surface.blit(text_cache.render(self.font, f"Level {level_number}", color), (10, 10))
+
+        score_text = text_cache.render(self.font, f"Score: {score}", color)
+        surface.blit(score_text, score_text.get_rect(center=(self.width // 2, 20)))
+
+        for i in range(3):
+            heart = self.heart_full if i < lives else self.heart_empty
+            surface.blit(heart, (self.width - 40 - i * 40, 10))
+
+        dash_text = text_cache.render(self.small_font, dash_status, color)
+        surface.blit(dash_text, dash_text.get_rect(center=(self.width // 2 - 55, 50)))
+
+        shield_text = text_cache.render(self.small_font, shield_status, color)
+        surface.blit(shield_text, shield_text.get_rect(center=(self.width // 2 + 55, 50)))
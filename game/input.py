@@ -0,0 +1,10 @@
+import pygame
+
+class KeyboardInput:
+    """Live input from pygame; swap in an object with the same methods to script a session."""
+
+    def events(self):
+        return pygame.event.get()
+
+    def pressed(self):
+        return pygame.key.get_pressed()
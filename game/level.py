@@ -1,6 +1,12 @@
 import pygame
 import json
 import os
+from game import level_format
+from game.spatial import SpatialHash, OccupancyGrid
+from config.settings import settings
+
+# Parsed, indexed level data keyed by content hash, so reloading a level never re-parses it
+_level_cache = {}
 
 class Level:
     def __init__(self, level_file):
@@ -15,8 +21,12 @@ class Level:
     def load_level(self, level_file):
         if os.path.exists(level_file):
             try:
-                with open(level_file, "r") as f:
-                    level_data = json.load(f)
+                content_hash = level_format.source_hash(level_file)
+                cached = _level_cache.get(content_hash)
+                if cached is not None:
+                    self.restore(cached)
+                    return
+                level_data = level_format.read_layers(level_file, content_hash)
                 
                 for x, y, w, h, index in level_data.get("tiles", []):
                     self.physics_tiles.append((pygame.Rect(x, y, w, h), index))
@@ -41,12 +51,37 @@ class Level:
                     )
                     self.width = max(self.width, max_x + 50)
                     self.height = max(self.height, max_y + 50)
+                
+                self.build_index()
+                _level_cache[content_hash] = self.snapshot()
+                return
                     
-            except (json.JSONDecodeError, IOError) as e:
+            except (json.JSONDecodeError, IOError, ValueError) as e:
                 print(f"Error loading {level_file}: {e}")
                 self.create_default_level()
         else:
             self.create_default_level()
+        self.build_index()
+
+    def snapshot(self):
+        """Capture the freshly loaded state for the level cache."""
+        return {
+            "physics_tiles": self.physics_tiles,
+            "decorative_tiles": self.decorative_tiles,
+            "collectibles": list(self.collectibles),
+            "enemies": list(self.enemies),
+            "width": self.width,
+            "height": self.height,
+            "tile_index": self.tile_index,
+            "decor_index": self.decor_index,
+            "occupancy": self.occupancy,
+            "patrol_cycles": self.patrol_cycles,
+        }
+
+    def restore(self, cached):
+        """Adopt cached state. Static geometry is shared; per-run lists are copied."""
+        for name, value in cached.items():
+            setattr(self, name, list(value) if name in ("collectibles", "enemies") else value)
 
     def create_default_level(self):
         for x in range(0, self.width, 50):
@@ -56,4 +91,36 @@ class Level:
         self.collectibles.append((pygame.Rect(350, 350, 32, 32), 0))
         self.collectibles.append((pygame.Rect(550, 250, 32, 32), 1))
         self.enemies.append((pygame.Rect(500, 270, 32, 32), "walker"))
-        self.decorative_tiles.append((pygame.Rect(100, 450, 50, 50), 0))
\ No newline at end of file
+        self.decorative_tiles.append((pygame.Rect(100, 450, 50, 50), 0))
+
+    def build_index(self):
+        """Bucket the static tiles into uniform grids so movers and the renderer only visit nearby tiles."""
+        self.tile_index = SpatialHash(settings.collision_cell_size)
+        for tile, _ in self.physics_tiles:
+            self.tile_index.insert(tile)
+        self.decor_index = SpatialHash(settings.collision_cell_size)
+        for dec, _ in self.decorative_tiles:
+            self.decor_index.insert(dec)
+        # Cached with the level, so line-of-sight results survive a reload of the same geometry
+        self.occupancy = OccupancyGrid(settings.tile_size, self.width, self.height, settings.los_cache_size)
+        for tile, _ in self.physics_tiles:
+            self.occupancy.fill(tile)
+        # Spawn index -> PatrolCycle, recorded by the first EnemyActivation set up for this level
+        self.patrol_cycles = {}
+
+    def query(self, rect):
+        """Return the physics tile rects overlapping rect."""
+        return self.tile_index.query(rect)
+
+    def line_of_sight(self, start, end):
+        """True if no physics tile blocks the line between two world points, to tile precision."""
+        occupancy = self.occupancy
+        return occupancy.line_of_sight(occupancy.cell_at(*start), occupancy.cell_at(*end))
+
+    def visible_physics_tiles(self, view):
+        """Return the (rect, index) physics tiles overlapping the view rect."""
+        return [self.physics_tiles[i] for i in self.tile_index.query_indices(view)]
+
+    def visible_decorative_tiles(self, view):
+        """Return the (rect, index) decor tiles overlapping the view rect."""
+        return [self.decorative_tiles[i] for i in self.decor_index.query_indices(view)]
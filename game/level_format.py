@@ -0,0 +1,107 @@
+"""Compact binary level format (.lvl) and converter from the JSON level files.
+
+Layout, little-endian:
+    header   magic b"SMLV", uint16 version, uint16 reserved,
+             32-byte SHA-256 of the source JSON,
+             uint32 record counts for tiles, decor, collectibles, enemies
+    body     one int32 array per layer, in the same order, five values per
+             record: x, y, w, h, index (for enemies, index into ENEMY_TYPES)
+
+Convert with:  python -m game.level_format levels/*.json
+"""
+import hashlib
+import json
+import mmap
+import os
+import struct
+import sys
+
+import numpy as np
+
+MAGIC = b"SMLV"
+VERSION = 1
+HEADER = struct.Struct("<4sHH32s4I")
+LAYERS = ("tiles", "decor", "collectibles", "enemies")
+ENEMY_TYPES = ("walker", "shooter")
+RECORD = np.dtype("<i4")
+
+def compiled_path(json_path):
+    return os.path.splitext(json_path)[0] + ".lvl"
+
+def json_hash(json_path):
+    with open(json_path, "rb") as f:
+        return hashlib.sha256(f.read()).digest()
+
+def read_header(lvl_path):
+    with open(lvl_path, "rb") as f:
+        data = f.read(HEADER.size)
+    if len(data) < HEADER.size:
+        raise ValueError(f"{lvl_path} is truncated")
+    magic, version, _, source_hash, *counts = HEADER.unpack(data)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError(f"{lvl_path} is not a version {VERSION} level file")
+    return source_hash, counts
+
+def source_hash(level_file):
+    """Hash identifying a level's content, whichever form it is stored in."""
+    if level_file.endswith(".lvl"):
+        return read_header(level_file)[0]
+    return json_hash(level_file)
+
+def compile_level(json_path, lvl_path=None):
+    """Convert a JSON level into the binary format; returns the path written."""
+    lvl_path = lvl_path or compiled_path(json_path)
+    with open(json_path, "rb") as f:
+        raw = f.read()
+    level_data = json.loads(raw)
+
+    arrays = []
+    for layer in LAYERS:
+        records = level_data.get(layer, [])
+        if layer == "enemies":
+            records = [(x, y, w, h, ENEMY_TYPES.index(kind)) for x, y, w, h, kind in records]
+        arrays.append(np.asarray(records, dtype=RECORD).reshape(-1, 5))
+
+    with open(lvl_path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, 0, hashlib.sha256(raw).digest(), *(len(a) for a in arrays)))
+        for array in arrays:
+            f.write(array.tobytes())
+    return lvl_path
+
+def read_compiled(lvl_path):
+    """Memory-map a .lvl file and return its layers as {name: [(x, y, w, h, index), ...]}."""
+    _, counts = read_header(lvl_path)
+    with open(lvl_path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            offset = HEADER.size
+            layers = {}
+            for layer, count in zip(LAYERS, counts):
+                records = np.frombuffer(mapped, dtype=RECORD, count=count * 5, offset=offset).reshape(-1, 5)
+                layers[layer] = [tuple(r) for r in records.tolist()]
+                offset += count * 5 * RECORD.itemsize
+                del records
+    layers["enemies"] = [(x, y, w, h, ENEMY_TYPES[kind]) for x, y, w, h, kind in layers["enemies"]]
+    return layers
+
+def read_layers(level_file, content_hash):
+    """Load a level's layers, preferring an up-to-date compiled file over parsing JSON."""
+    if level_file.endswith(".lvl"):
+        return read_compiled(level_file)
+    lvl_path = compiled_path(level_file)
+    if os.path.exists(lvl_path):
+        try:
+            if read_header(lvl_path)[0] == content_hash:
+                return read_compiled(lvl_path)
+        except ValueError as e:
+            print(f"Ignoring {lvl_path}: {e}")
+    with open(level_file, "r") as f:
+        level_data = json.load(f)
+    return {layer: [tuple(r) for r in level_data.get(layer, [])] for layer in LAYERS}
+
+def main(paths):
+    for json_path in paths:
+        lvl_path = compile_level(json_path)
+        print(f"{json_path} ({os.path.getsize(json_path)} bytes) -> {lvl_path} ({os.path.getsize(lvl_path)} bytes)")
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -0,0 +1,86 @@
+import pygame
+
+def is_opaque(surface):
+    """True if blitting surface overwrites every pixel under it."""
+    if surface.get_flags() & pygame.SRCALPHA:
+        return pygame.mask.from_surface(surface, 254).count() == surface.get_width() * surface.get_height()
+    if surface.get_colorkey() is None:
+        return True
+    return pygame.mask.from_surface(surface).count() == surface.get_width() * surface.get_height()
+
+class ParallaxRenderer:
+    """Draws the scrolling background layers out of pre-composited wrap-around strips.
+
+    Layers behind an opaque layer can never show and are dropped. Neighbouring
+    layers with the same scroll speed and size are composited into one strip.
+    Each strip is its layer repeated to one screen wider than the layer, so any
+    scroll position is one blit across and at most two down, every one of them
+    clipped to the screen. pixels counts what the last frame wrote.
+    """
+
+    def __init__(self, layers, screen_width, screen_height, fill_color=(0, 0, 0)):
+        """layers are (surface, speed) pairs, back to front."""
+        self.screen_width = screen_width
+        self.screen_height = screen_height
+        self.fill_color = fill_color
+        self.layer_count = len(layers)
+
+        groups = []
+        for surface, speed in layers:
+            if is_opaque(surface):
+                groups = []
+            if groups and groups[-1][1] == speed and groups[-1][0][0].get_size() == surface.get_size():
+                groups[-1][0].append(surface)
+            else:
+                groups.append(([surface], speed))
+        # Nothing drawn needs a clear underneath when the backmost strip is opaque
+        self.needs_fill = not groups or not is_opaque(groups[0][0][0])
+        self.strips = [(self.build_strip(surfaces), surfaces[0].get_size(), speed) for surfaces, speed in groups]
+        self.pixels = 0
+
+    def build_strip(self, surfaces):
+        width, height = surfaces[0].get_size()
+        size = (width + self.screen_width, height)
+        keys = {surface.get_colorkey() for surface in surfaces}
+        if is_opaque(surfaces[0]):
+            strip = pygame.Surface(size).convert()
+            key = None
+        elif len(keys) == 1 and None not in keys and not any(surface.get_flags() & pygame.SRCALPHA for surface in surfaces):
+            key = keys.pop()
+            strip = pygame.Surface(size).convert()
+            strip.fill(key)
+        else:
+            strip = pygame.Surface(size, pygame.SRCALPHA).convert_alpha()
+            strip.fill((0, 0, 0, 0))
+            key = None
+        for surface in surfaces:
+            for x in range(0, size[0], width):
+                strip.blit(surface, (x, 0))
+        if key is not None:
+            # Run-length encoding lets the blit skip the transparent runs
+            strip.set_colorkey(key, pygame.RLEACCEL)
+        return strip
+
+    def draw(self, screen, offset, shake=(0, 0)):
+        """Draw every visible layer for camera offset, displaced by the screen shake."""
+        screen_width, screen_height = self.screen_width, self.screen_height
+        pixels = 0
+        if self.needs_fill:
+            screen.fill(self.fill_color)
+            pixels += screen_width * screen_height
+        for strip, (width, height), speed in self.strips:
+            # Same placement the per-tile loop used: layers tile from their vertical centre
+            x = int(offset[0] * speed - shake[0]) % width
+            y = int(offset[1] * speed + (height - screen_height) // 2 - shake[1]) % height
+            top = 0
+            while top < screen_height:
+                rows = min(height - y, screen_height - top)
+                screen.blit(strip, (0, top), (x, y, screen_width, rows))
+                pixels += screen_width * rows
+                top += rows
+                y = 0
+        self.pixels = pixels
+
+    def naive_pixels(self):
+        """What a clear plus one full-screen pass per layer would write per frame."""
+        return (self.layer_count + 1) * self.screen_width * self.screen_height
@@ -1,19 +1,62 @@
-import pygame
-import random
-from config.settings import Settings
+import numpy as np
+from config.settings import settings
 
-settings = Settings()
+class ParticleSystem:
+    """Fixed-capacity particle pool stored as NumPy arrays (structure of arrays).
 
-class Particle:
-    def __init__(self, x, y):
-        self.rect = pygame.Rect(x, y, *settings.particle_size)
-        self.velocity = pygame.Vector2(random.uniform(-2, 2), random.uniform(-2, -1))
-        self.lifetime = settings.particle_lifetime
+    Live particles are kept packed at the front of the arrays; update() moves and
+    ages them in one vectorized step and compacts out the dead ones.
+    """
+
+    def __init__(self, capacity=None, lifetime=None):
+        self.capacity = capacity or settings.max_particles
+        self.lifetime = lifetime or settings.particle_lifetime
+        self.positions = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.velocities = np.zeros((self.capacity, 2), dtype=np.float32)
+        self.lifetimes = np.zeros(self.capacity, dtype=np.int32)
+        self.count = 0
+        self.dropped = 0
+        self.rng = np.random.default_rng()
+
+    def __len__(self):
+        return self.count
+
+    def emit(self, x, y, count=15, speed_x=3, speed_y=3):
+        """Spawn count particles at (x, y) flying up and outwards; excess beyond capacity is dropped."""
+        start = self.count
+        end = min(self.capacity, start + count)
+        self.dropped += count - (end - start)
+        if end == start:
+            return
+        n = end - start
+        self.positions[start:end] = (x, y)
+        self.velocities[start:end, 0] = self.rng.uniform(-speed_x, speed_x, n)
+        self.velocities[start:end, 1] = self.rng.uniform(-speed_y, 0, n)
+        self.lifetimes[start:end] = self.lifetime
+        self.count = end
 
     def update(self):
-        self.rect.x += self.velocity.x
-        self.rect.y += self.velocity.y
-        self.lifetime -= 1
+        n = self.count
+        if n == 0:
+            return
+        self.positions[:n] += self.velocities[:n]
+        self.lifetimes[:n] -= 1
+        alive = self.lifetimes[:n] > 0
+        remaining = int(np.count_nonzero(alive))
+        if remaining < n:
+            self.positions[:remaining] = self.positions[:n][alive]
+            self.velocities[:remaining] = self.velocities[:n][alive]
+            self.lifetimes[:remaining] = self.lifetimes[:n][alive]
+            self.count = remaining
+
+    def clear(self):
+        self.count = 0
 
-    def is_alive(self):
-        return self.lifetime > 0
\ No newline at end of file
+    def blit_sequence(self, sprite, offset_x, offset_y):
+        """Return (sprite, (x, y)) pairs for every live particle, shifted into screen space."""
+        n = self.count
+        if n == 0:
+            return []
+        xs = (self.positions[:n, 0] + offset_x).astype(np.int32).tolist()
+        ys = (self.positions[:n, 1] + offset_y).astype(np.int32).tolist()
+        return [(sprite, pos) for pos in zip(xs, ys)]
@@ -1,13 +1,30 @@
 import pygame
-from game.particle import Particle
-from config.settings import Settings
-import random 
+from game.assets import assets
+from game.render_queue import LAYER_ENTITIES
+from game.timestep import interpolate_rect
+from config.settings import settings
 
-
-settings = Settings()
 class Player:
+    ANIMATIONS = {
+        "idle": [
+            "Assets/Player/Player-Idle/idle-01.png",
+            "Assets/Player/Player-Idle/idle-02.png"
+        ],
+        "run": [
+            "Assets/Player/Player-Run/Run-01.png",
+            "Assets/Player/Player-Run/Run-02.png",
+            "Assets/Player/Player-Run/Run-03.png",
+            "Assets/Player/Player-Run/Run-04.png",
+            "Assets/Player/Player-Run/Run-05.png",
+            "Assets/Player/Player-Run/Run-06.png",
+            "Assets/Player/Player-Run/Run-07.png",
+            "Assets/Player/Player-Run/Run-08.png"
+        ]
+    }
+
     def __init__(self, x, y, game=None):
         self.rect = pygame.Rect(x, y, *settings.player_size)
+        self.previous_pos = self.rect.topleft
         self.velocity = pygame.Vector2(0, 0)
         self.speed = settings.player_speed
         self.jump_power = settings.player_jump_power
@@ -19,32 +36,18 @@ class Player:
         self.dash_cooldown = 60
         self.dash_cooldown_timer = 0
         self.facing_right = True
+        self.jumped = False
         self.game = game
-        self.particles = []
         
-        self.animations = {
-            "idle": [pygame.image.load(file).convert_alpha() for file in [
-                "Assets/Player/Player-Idle/idle-01.png",
-                "Assets/Player/Player-Idle/idle-02.png"
-            ]],
-            "run": [pygame.image.load(file).convert_alpha() for file in [
-                "Assets/Player/Player-Run/Run-01.png",
-                "Assets/Player/Player-Run/Run-02.png",
-                "Assets/Player/Player-Run/Run-03.png",
-                "Assets/Player/Player-Run/Run-04.png",
-                "Assets/Player/Player-Run/Run-05.png",
-                "Assets/Player/Player-Run/Run-06.png",
-                "Assets/Player/Player-Run/Run-07.png",
-                "Assets/Player/Player-Run/Run-08.png"
-            ]]
-        }
+        self.animations = assets.atlas(self.ANIMATIONS)
         self.current_animation = "idle"
         self.frame_index = 0
         self.animation_speed = 0.1
         self.animation_timer = 0
 
-    def update(self, tiles):
-        keys = pygame.key.get_pressed()
+    def update(self, level, keys=None):
+        if keys is None:
+            keys = pygame.key.get_pressed()
         
         self.velocity.x = 0
         if not self.dashing:
@@ -81,27 +84,25 @@ class Player:
         elif self.dash_cooldown_timer > 0:
             self.dash_cooldown_timer -= 1
 
-        if keys[pygame.K_UP] and self.on_ground(tiles):
+        self.jumped = False
+        if keys[pygame.K_UP] and self.on_ground(level):
             self.velocity.y = self.jump_power
+            self.jumped = True
         
         self.velocity.y += self.gravity
         self.velocity.y = min(self.velocity.y, 15)
         
-        self.move(tiles)
+        self.move(level)
         
         self.animation_timer += self.animation_speed
         if self.animation_timer >= 1:
             self.frame_index = (self.frame_index + 1) % len(self.animations[self.current_animation])
             self.animation_timer = 0
-        
-        for particle in self.particles[:]:
-            particle.update()
-            if not particle.is_alive():
-                self.particles.remove(particle)
 
-    def move(self, tiles):
+
+    def move(self, level):
         self.rect.x += self.velocity.x
-        for tile in tiles:
+        for tile in level.query(self.rect):
             if self.rect.colliderect(tile):
                 if self.velocity.x > 0:
                     self.rect.right = tile.left
@@ -111,7 +112,7 @@ class Player:
         self.rect.clamp_ip(pygame.Rect(0, 0, settings.level_width, settings.level_height))
         
         self.rect.y += self.velocity.y
-        for tile in tiles:
+        for tile in level.query(self.rect):
             if self.rect.colliderect(tile):
                 if self.velocity.y > 0:
                     self.rect.bottom = tile.top
@@ -120,23 +121,24 @@ class Player:
                     self.rect.top = tile.bottom
                     self.velocity.y = 0
 
-    def on_ground(self, tiles):
+    def on_ground(self, level):
         self.rect.y += 2
-        on_ground = any(self.rect.colliderect(tile) for tile in tiles)
+        on_ground = bool(level.query(self.rect))
         self.rect.y -= 2
         return on_ground
 
     def spawn_particles(self, x, y, count=15):
         """Spawn particles at given position with specified count."""
-        for _ in range(count):
-            particle = Particle(x, y)
-            particle.velocity.x = random.uniform(-3, 3)
-            particle.velocity.y = random.uniform(-3, 0)
-            self.particles.append(particle)
+        if self.game:
+            self.game.particles.emit(x, y, count)
+
+    def snapshot(self):
+        """Remember where the player was before the next simulation tick."""
+        self.previous_pos = self.rect.topleft
+
+    def render_rect(self, alpha):
+        return interpolate_rect(self.rect, self.previous_pos, alpha)
 
-    def draw(self, screen, camera):
-        frame = self.animations[self.current_animation][self.frame_index]
-        if not self.facing_right:
-            frame = pygame.transform.flip(frame, True, False)
-        adjusted_rect = camera.apply(self.rect)
-        screen.blit(frame, adjusted_rect)
\ No newline at end of file
+    def draw(self, queue, camera, alpha=1.0):
+        frame = self.animations.frame(self.current_animation, self.frame_index, flipped=not self.facing_right)
+        queue.add(LAYER_ENTITIES, frame, camera.apply(self.render_rect(alpha)))
\ No newline at end of file
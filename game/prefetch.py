@@ -0,0 +1,48 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+class LevelPrefetcher:
+    """Builds upcoming levels on a worker thread so switching to one is just a swap.
+
+    build is called with a level file and returns whatever the caller needs to
+    start that level. request() may be called as often as convenient; each
+    file is built at most once until it is taken.
+    """
+
+    def __init__(self, build):
+        self.build = build
+        self.executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="level-prefetch")
+        self.pending = {}
+        self.last_wait_ms = 0.0
+        self.prefetched = 0
+        self.missed = 0
+
+    def request(self, level_file):
+        if level_file not in self.pending:
+            self.pending[level_file] = self.executor.submit(self.build, level_file)
+
+    def take(self, level_file):
+        """Return the built level, waiting for (or doing) any work still outstanding."""
+        start = time.perf_counter()
+        future = self.pending.pop(level_file, None)
+        if future is None:
+            self.missed += 1
+            result = self.build(level_file)
+        else:
+            if future.done():
+                self.prefetched += 1
+            else:
+                self.missed += 1
+            result = future.result()
+        self.last_wait_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    def clear(self):
+        """Drop every pending build, e.g. when the state they were built against is reset."""
+        for future in self.pending.values():
+            future.cancel()
+        self.pending.clear()
+
+    def shutdown(self):
+        self.clear()
+        self.executor.shutdown(wait=False)
@@ -0,0 +1,159 @@
+import cProfile
+import io
+import json
+import os
+import pstats
+import time
+from collections import deque
+
+import pygame
+
+class _Phase:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        end = time.perf_counter()
+        profiler = self.profiler
+        current = profiler.current
+        current[self.name] = current.get(self.name, 0.0) + end - self.start
+        profiler.events.append((self.name, self.start, end - self.start))
+        return False
+
+class _NullPhase:
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+_NULL_PHASE = _NullPhase()
+
+class Profiler:
+    """Records how long each named phase of the game loop takes, frame by frame.
+
+    When disabled, phase() hands back a shared no-op context manager so the
+    instrumented loop pays almost nothing. Enabled, it keeps a rolling window of
+    frames for the overlay and for Chrome trace export, and can wrap the next
+    few frames in cProfile.
+    """
+
+    def __init__(self, enabled=True, history=600, output_dir="profiles"):
+        self.enabled = enabled
+        self.frames = deque(maxlen=history)
+        self.frame_events = deque(maxlen=history)
+        self.current = {}
+        self.events = []
+        self.frame_start = time.perf_counter()
+        self.output_dir = output_dir
+        self.cprofile = None
+        self.capture_frames_left = 0
+        self.font = None
+
+    def phase(self, name):
+        if not self.enabled:
+            return _NULL_PHASE
+        return _Phase(self, name)
+
+    def toggle(self):
+        self.enabled = not self.enabled
+        self.current = {}
+        self.events = []
+
+    def end_frame(self):
+        now = time.perf_counter()
+        if self.enabled:
+            self.current["frame"] = now - self.frame_start
+            self.events.append(("frame", self.frame_start, now - self.frame_start))
+            self.frames.append(self.current)
+            self.frame_events.append(self.events)
+            self.current = {}
+            self.events = []
+        self.frame_start = now
+        if self.cprofile is not None:
+            self.capture_frames_left -= 1
+            if self.capture_frames_left <= 0:
+                self._finish_capture()
+
+    def samples(self, name):
+        return [frame.get(name, 0.0) for frame in self.frames]
+
+    def summary(self):
+        """Return {phase: (average ms, p99 ms)} over the rolling window."""
+        names = []
+        for frame in self.frames:
+            for name in frame:
+                if name not in names:
+                    names.append(name)
+        result = {}
+        for name in names:
+            values = [t * 1000 for t in self.samples(name)]
+            result[name] = (sum(values) / len(values), percentile(values, 99))
+        return result
+
+    def capture(self, frames):
+        """Run cProfile over the next frames frames and write the stats to output_dir."""
+        if self.cprofile is not None:
+            return
+        self.cprofile = cProfile.Profile()
+        self.capture_frames_left = frames
+        self.cprofile.enable()
+        print(f"Capturing cProfile data for {frames} frames")
+
+    def _finish_capture(self):
+        self.cprofile.disable()
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, f"capture-{time.strftime('%Y%m%d-%H%M%S')}.prof")
+        self.cprofile.dump_stats(path)
+        report = io.StringIO()
+        pstats.Stats(self.cprofile, stream=report).sort_stats("cumulative").print_stats(15)
+        print(f"cProfile capture written to {path}")
+        print(report.getvalue())
+        self.cprofile = None
+
+    def export_trace(self, path=None):
+        """Write the rolling window as Chrome trace-event JSON (open in chrome://tracing or Perfetto)."""
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = path or os.path.join(self.output_dir, f"trace-{time.strftime('%Y%m%d-%H%M%S')}.json")
+        trace = []
+        for events in self.frame_events:
+            for name, start, duration in events:
+                trace.append({"name": name, "ph": "X", "ts": start * 1e6, "dur": duration * 1e6, "pid": 0, "tid": 0})
+        with open(path, "w") as f:
+            json.dump({"traceEvents": trace, "displayTimeUnit": "ms"}, f)
+        print(f"Trace written to {path}")
+        return path
+
+    def draw_overlay(self, screen, counters=None):
+        if self.font is None:
+            self.font = pygame.font.SysFont("monospace", 14)
+        font = self.font
+        lines = [f"{'phase':<10}{'avg ms':>8}{'p99 ms':>8}"]
+        for name, (average, p99) in self.summary().items():
+            lines.append(f"{name:<10}{average:>8.2f}{p99:>8.2f}")
+        for name, value in (counters or {}).items():
+            lines.append(f"{name}: {value}")
+        line_height = font.get_linesize()
+        rendered = [font.render(line, True, (0, 255, 0)) for line in lines]
+        width = max(260, max(surface.get_width() for surface in rendered) + 10)
+        panel = pygame.Surface((width, line_height * len(lines) + 10), pygame.SRCALPHA)
+        panel.fill((0, 0, 0, 170))
+        for i, surface in enumerate(rendered):
+            panel.blit(surface, (5, 5 + i * line_height))
+        screen.blit(panel, (10, screen.get_height() - panel.get_height() - 10))
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
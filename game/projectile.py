@@ -1,61 +1,79 @@
 import pygame
 import os
-import random
-from config.settings import Settings
-
-settings = Settings()
+from game.assets import assets
+from game.render_queue import LAYER_ENTITIES
+from game.timestep import interpolate_rect
 
 class Projectile:
+    ANIMATIONS = {
+        "fly": [os.path.join("Assets", "Enemies", "Lizzard", "Fireball", f"fireball{i}.png") for i in range(1, 5)]
+    }
+
     def __init__(self, x, y, direction):
         self.rect = pygame.Rect(x, y, 16, 16)
         self.velocity = pygame.Vector2(direction * 5, 0)
-        self.animations = [pygame.image.load(os.path.join("Assets", "Enemies", "Lizzard", "Fireball", f"fireball{i}.png")).convert_alpha() for i in range(1, 5)]
-        self.frame_index = 0
+        self.animations = assets.atlas(self.ANIMATIONS)
         self.animation_speed = 0.2
+        self.reset(x, y, direction)
+
+    def reset(self, x, y, direction):
+        """Put a recycled projectile back into its just-fired state."""
+        self.rect.topleft = (x, y)
+        self.previous_pos = self.rect.topleft
+        self.velocity.update(direction * 5, 0)
+        self.frame_index = 0
         self.animation_timer = 0
-        self.particles = []
         self.remove = False
 
-    def update(self, tiles):
+    def update(self, level):
         self.rect.x += self.velocity.x
         
-        for tile in tiles:
-            if self.rect.colliderect(tile):
-                self.spawn_particles()
-                self.remove = True
-                break
+        if level.query(self.rect):
+            self.remove = True
         
         if not self.remove:
             self.animation_timer += self.animation_speed
             if self.animation_timer >= 1:
-                self.frame_index = (self.frame_index + 1) % len(self.animations)
+                self.frame_index = (self.frame_index + 1) % len(self.animations["fly"])
                 self.animation_timer = 0
 
-    def spawn_particles(self):
-        for _ in range(10):
-            particle = pygame.Rect(self.rect.centerx, self.rect.centery, *settings.particle_size)
-            particle_velocity = pygame.Vector2(random.uniform(-3, 3), random.uniform(-3, 0))
-            self.particles.append((particle, particle_velocity, settings.particle_lifetime))
-
-    def update_particles(self):
-        remaining_particles = []
-        for particle, velocity, lifetime in self.particles[:]:
-            particle.x += velocity.x
-            particle.y += velocity.y
-            lifetime -= 1
-            if lifetime > 0:
-                remaining_particles.append((particle, velocity, lifetime))
-        self.particles = remaining_particles
-        return self.particles
-
-    def draw(self, screen, camera):
+    def spawn_particles(self, particles):
+        particles.emit(self.rect.centerx, self.rect.centery, 10)
+
+    def snapshot(self):
+        self.previous_pos = self.rect.topleft
+
+    def draw(self, queue, camera, alpha=1.0):
         if not self.remove:
-            frame = self.animations[self.frame_index]
-            if self.velocity.x < 0:
-                frame = pygame.transform.flip(frame, True, False)
-            adjusted_rect = camera.apply(self.rect)
-            screen.blit(frame, adjusted_rect)
-        
-        for particle, _, _ in self.particles:
-            adjusted_particle_rect = camera.apply(particle)
-            pygame.draw.rect(screen, settings.particle_color, adjusted_particle_rect)
\ No newline at end of file
+            frame = self.animations.frame("fly", self.frame_index, flipped=self.velocity.x < 0)
+            queue.add(LAYER_ENTITIES, frame, camera.apply(interpolate_rect(self.rect, self.previous_pos, alpha)))
+
+class ProjectilePool:
+    """Recycles Projectile instances so bursts of shots don't allocate new ones."""
+
+    def __init__(self):
+        self.free = []
+        self.in_use = 0
+        self.high_water = 0
+        self.created = 0
+        self.reused = 0
+
+    def acquire(self, x, y, direction):
+        if self.free:
+            projectile = self.free.pop()
+            projectile.reset(x, y, direction)
+            self.reused += 1
+        else:
+            projectile = Projectile(x, y, direction)
+            self.created += 1
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        return projectile
+
+    def release(self, projectile):
+        self.in_use -= 1
+        self.free.append(projectile)
+
+    def stats(self):
+        return {"in_use": self.in_use, "free": len(self.free), "high_water": self.high_water,
+                "created": self.created, "reused": self.reused}
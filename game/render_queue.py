@@ -0,0 +1,45 @@
+import pygame
+
+# Draw layers, back to front
+LAYER_BACKGROUND = 0
+LAYER_DECOR = 1
+LAYER_TILES = 2
+LAYER_COLLECTIBLES = 3
+LAYER_ENTITIES = 4
+LAYER_PARTICLES = 5
+LAYER_HUD = 6
+LAYER_COUNT = 7
+
+class RenderQueue:
+    """Collects (surface, dest) pairs per layer and submits each layer in one batched blit."""
+
+    def __init__(self):
+        self.layers = [[] for _ in range(LAYER_COUNT)]
+        self.submitted = 0
+        self.batches = 0
+        # fblits (pygame-ce) skips building the list of dirty rects blits() would return
+        self._fblits = getattr(pygame.Surface, "fblits", None)
+
+    def begin_frame(self):
+        """Reset the per-frame blit and batch counters."""
+        self.submitted = 0
+        self.batches = 0
+
+    def add(self, layer, surface, dest):
+        self.layers[layer].append((surface, dest))
+
+    def extend(self, layer, pairs):
+        self.layers[layer].extend(pairs)
+
+    def flush(self, screen, last_layer=LAYER_HUD):
+        """Blit every queued layer up to and including last_layer, back to front."""
+        for sequence in self.layers[:last_layer + 1]:
+            if not sequence:
+                continue
+            if self._fblits is not None:
+                self._fblits(screen, sequence)
+            else:
+                screen.blits(sequence, doreturn=False)
+            self.submitted += len(sequence)
+            self.batches += 1
+            sequence.clear()
@@ -0,0 +1,133 @@
+class SpatialHash:
+    """Uniform grid of buckets mapping cells to the static rects that overlap them."""
+
+    def __init__(self, cell_size=128):
+        self.cell_size = cell_size
+        self.buckets = {}
+        self.rects = []
+
+    def insert(self, rect):
+        index = len(self.rects)
+        self.rects.append(rect)
+        for cell in self.cells_for(rect):
+            self.buckets.setdefault(cell, []).append(index)
+        return index
+
+    def cells_for(self, rect):
+        size = self.cell_size
+        left = rect.left // size
+        top = rect.top // size
+        right = (rect.right - 1) // size
+        bottom = (rect.bottom - 1) // size
+        for cx in range(left, right + 1):
+            for cy in range(top, bottom + 1):
+                yield cx, cy
+
+    def candidates(self, rect):
+        """Indices of every stored rect sharing a cell with rect, in insertion order."""
+        found = set()
+        buckets = self.buckets
+        for cell in self.cells_for(rect):
+            bucket = buckets.get(cell)
+            if bucket:
+                found.update(bucket)
+        return sorted(found)
+
+    def query_indices(self, rect):
+        """Return the insertion indices of the stored rects overlapping rect."""
+        rects = self.rects
+        return [i for i in self.candidates(rect) if rect.colliderect(rects[i])]
+
+    def query(self, rect):
+        """Return the stored rects overlapping rect, in insertion order."""
+        rects = self.rects
+        return [rects[i] for i in self.candidates(rect) if rect.colliderect(rects[i])]
+
+    def __len__(self):
+        return len(self.rects)
+
+
+class OccupancyGrid:
+    """Solid/empty flag per cell of a uniform grid over the static tiles, for raycasts.
+
+    A cell is solid if any tile overlaps it. Ray results are memoized per
+    (start cell, end cell) pair and the memo is dropped whenever a cell changes.
+    """
+
+    def __init__(self, cell_size, width, height, cache_size=4096):
+        self.cell_size = cell_size
+        self.columns = -(-width // cell_size)
+        self.rows = -(-height // cell_size)
+        self.cells = bytearray(self.columns * self.rows)
+        self.cache_size = cache_size
+        self.memo = {}
+        self.casts = 0
+        self.hits = 0
+
+    def fill(self, rect, solid=True):
+        size = self.cell_size
+        for cx in range(max(rect.left // size, 0), min((rect.right - 1) // size + 1, self.columns)):
+            for cy in range(max(rect.top // size, 0), min((rect.bottom - 1) // size + 1, self.rows)):
+                self.cells[cy * self.columns + cx] = solid
+        self.memo.clear()
+
+    def solid(self, cx, cy):
+        """Outside the grid counts as empty, as there are no tiles there."""
+        return 0 <= cx < self.columns and 0 <= cy < self.rows and self.cells[cy * self.columns + cx]
+
+    def cell_at(self, x, y):
+        return int(x) // self.cell_size, int(y) // self.cell_size
+
+    def line_of_sight(self, start, end):
+        """True if no solid cell lies on the line between the centres of two cells.
+
+        The endpoints themselves are not tested. A ray passing exactly through
+        a corner is blocked if either cell beside the corner is solid.
+        """
+        key = (start, end)
+        clear = self.memo.get(key)
+        if clear is not None:
+            self.hits += 1
+            return clear
+        self.casts += 1
+        clear = self.cast(start, end)
+        if len(self.memo) >= self.cache_size:
+            # Rays are cheap to recompute; dropping everything beats tracking recency
+            self.memo.clear()
+        self.memo[key] = clear
+        return clear
+
+    def cast(self, start, end):
+        # Amanatides-Woo DDA between cell centres, in cell units
+        if start == end:
+            return True
+        cx, cy = start
+        end_x, end_y = end
+        dx = end_x - cx
+        dy = end_y - cy
+        step_x = (dx > 0) - (dx < 0)
+        step_y = (dy > 0) - (dy < 0)
+        # Ray parameter t runs 0..1; a centre is half a cell from either edge
+        delta_x = 1 / abs(dx) if dx else float("inf")
+        delta_y = 1 / abs(dy) if dy else float("inf")
+        next_x = delta_x / 2
+        next_y = delta_y / 2
+        solid = self.solid
+        while True:
+            if next_x < next_y:
+                cx += step_x
+                next_x += delta_x
+            elif next_y < next_x:
+                cy += step_y
+                next_y += delta_y
+            else:
+                if solid(cx + step_x, cy) or solid(cx, cy + step_y):
+                    return False
+                cx += step_x
+                cy += step_y
+                next_x += delta_x
+                next_y += delta_y
+            if (cx, cy) == (end_x, end_y):
+                return True
+            if solid(cx, cy):
+                return False
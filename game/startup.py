@@ -0,0 +1,96 @@
+"""Startup timing for main.py --startup-profile.
+
+StartupTimer splits time-to-first-frame into named stages. ImportTimer is a
+meta-path hook that times every module imported while it is installed. It
+records self time, so a module's figure excludes the imports it triggers
+itself.
+"""
+import sys
+import time
+
+class StartupTimer:
+    def __init__(self, start=None):
+        self.start = self.last = start or time.perf_counter()
+        self.stages = {}
+
+    def mark(self, name):
+        """Close the current stage under name and start the next."""
+        now = time.perf_counter()
+        self.stages[name] = now - self.last
+        self.last = now
+
+    @property
+    def total(self):
+        return self.last - self.start
+
+class ImportTimer:
+    def __init__(self):
+        self.times = {}
+        self.stack = []
+
+    def install(self):
+        sys.meta_path.insert(0, self)
+        return self
+
+    def uninstall(self):
+        if self in sys.meta_path:
+            sys.meta_path.remove(self)
+
+    def find_spec(self, name, path=None, target=None):
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(name, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+        loader = spec.loader
+        # Built-in and frozen importers are shared classes; only wrap per-module loader instances
+        if loader is None or isinstance(loader, type) or not hasattr(loader, "exec_module"):
+            return spec
+        exec_module = loader.exec_module
+
+        def timed_exec_module(module):
+            start = time.perf_counter()
+            self.stack.append(0.0)
+            try:
+                exec_module(module)
+            finally:
+                total = time.perf_counter() - start
+                children = self.stack.pop()
+                self.times[name] = total - children
+                if self.stack:
+                    self.stack[-1] += total
+
+        loader.exec_module = timed_exec_module
+        return spec
+
+    def by_package(self):
+        """Return {top-level package: seconds}, largest first."""
+        totals = {}
+        for name, seconds in self.times.items():
+            package = name.split(".")[0]
+            totals[package] = totals.get(package, 0.0) + seconds
+        return dict(sorted(totals.items(), key=lambda item: -item[1]))
+
+    def slowest(self, count=10):
+        return sorted(self.times.items(), key=lambda item: -item[1])[:count]
+
+def print_report(startup_timer, import_timer, budget_ms):
+    """Print the startup breakdown; returns True when time-to-first-frame is within budget_ms."""
+    total = startup_timer.total
+    print(f"Time to first frame: {total * 1000:.1f} ms (budget {budget_ms} ms)")
+    print("Stages:")
+    for name, seconds in startup_timer.stages.items():
+        print(f"  {name:<20}{seconds * 1000:>9.1f} ms")
+    print("Imports by package:")
+    for package, seconds in list(import_timer.by_package().items())[:10]:
+        print(f"  {package:<20}{seconds * 1000:>9.1f} ms")
+    print("Slowest modules:")
+    for name, seconds in import_timer.slowest():
+        print(f"  {name:<32}{seconds * 1000:>9.1f} ms")
+    within = total * 1000 <= budget_ms
+    if not within:
+        print("Startup is over budget")
+    return within
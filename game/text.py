@@ -0,0 +1,38 @@
+from collections import OrderedDict
+import pygame
+from config.settings import settings
+
+class TextCache:
+    """Shared fonts plus an LRU cache of rendered text surfaces keyed on (font, text, color)."""
+
+    def __init__(self, capacity=None):
+        self.capacity = capacity or settings.text_cache_size
+        self.fonts = {}
+        self.surfaces = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def font(self, name, size):
+        key = (name, size)
+        font = self.fonts.get(key)
+        if font is None:
+            font = self.fonts[key] = pygame.font.Font(name, size)
+        return font
+
+    def render(self, font, text, color, antialias=True):
+        key = (font, text, tuple(color), antialias)
+        surface = self.surfaces.get(key)
+        if surface is not None:
+            self.surfaces.move_to_end(key)
+            self.hits += 1
+            return surface
+        self.misses += 1
+        surface = self.surfaces[key] = font.render(text, antialias, color)
+        if len(self.surfaces) > self.capacity:
+            self.surfaces.popitem(last=False)
+        return surface
+
+    def stats(self):
+        return {"hits": self.hits, "misses": self.misses, "cached": len(self.surfaces)}
+
+text_cache = TextCache()
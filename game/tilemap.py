@@ -0,0 +1,74 @@
+import pygame
+from collections import OrderedDict
+from config.settings import settings
+from game.render_queue import LAYER_TILES
+
+class TilemapRenderer:
+    """Bakes a level's static decor and physics tiles into chunk surfaces on first sight.
+
+    Chunks are kept in an LRU so long levels only hold the ones near the camera.
+    """
+
+    def __init__(self, level, tile_sprites, decor_sprites, chunk_size=None, max_chunks=None):
+        self.level = level
+        self.tile_sprites = tile_sprites
+        self.decor_sprites = decor_sprites
+        self.chunk_size = chunk_size or settings.tile_chunk_size
+        self.max_chunks = max_chunks or settings.max_tile_chunks
+        self.chunks = OrderedDict()
+        self.baked = 0
+        self.evicted = 0
+        # Tiles whose top-left falls in each chunk, so culling stats count every tile once
+        self.chunk_tiles = {}
+        self.tile_total = len(level.physics_tiles) + len(level.decorative_tiles)
+        # Sprites are blitted at their rect's top-left, so a tile can spill past its
+        # rect into the next chunk; query with this much overhang to catch it.
+        self.overhang = max(
+            [s.get_width() for s in tile_sprites + decor_sprites] +
+            [s.get_height() for s in tile_sprites + decor_sprites] + [0]
+        )
+
+    def chunk_rect(self, cx, cy):
+        return pygame.Rect(cx * self.chunk_size, cy * self.chunk_size, self.chunk_size, self.chunk_size)
+
+    def bake(self, cx, cy):
+        area = self.chunk_rect(cx, cy)
+        probe = pygame.Rect(area.x - self.overhang, area.y - self.overhang,
+                            area.width + self.overhang, area.height + self.overhang)
+        decor = self.level.visible_decorative_tiles(probe)
+        tiles = self.level.visible_physics_tiles(probe)
+        self.chunk_tiles[(cx, cy)] = sum(1 for rect, _ in decor + tiles if area.collidepoint(rect.topleft))
+        if not decor and not tiles:
+            return None
+        surface = pygame.Surface(area.size, pygame.SRCALPHA)
+        for dec, index in decor:
+            surface.blit(self.decor_sprites[index], (dec.x - area.x, dec.y - area.y))
+        for tile, index in tiles:
+            surface.blit(self.tile_sprites[index], (tile.x - area.x, tile.y - area.y))
+        self.baked += 1
+        return surface
+
+    def get_chunk(self, cx, cy):
+        key = (cx, cy)
+        if key in self.chunks:
+            self.chunks.move_to_end(key)
+            return self.chunks[key]
+        surface = self.bake(cx, cy)
+        self.chunks[key] = surface
+        while len(self.chunks) > self.max_chunks:
+            self.chunks.popitem(last=False)
+            self.evicted += 1
+        return surface
+
+    def draw(self, queue, camera, shake_offset, margin=1):
+        view = camera.view_rect(margin)
+        size = self.chunk_size
+        drawn = 0
+        for cx in range(view.left // size, (view.right - 1) // size + 1):
+            for cy in range(view.top // size, (view.bottom - 1) // size + 1):
+                surface = self.get_chunk(cx, cy)
+                drawn += self.chunk_tiles[(cx, cy)]
+                if surface is not None:
+                    adjusted_rect = camera.apply(self.chunk_rect(cx, cy)).move(shake_offset.x, shake_offset.y)
+                    queue.add(LAYER_TILES, surface, adjusted_rect)
+        camera.record_culling(drawn, self.tile_total)
@@ -0,0 +1,38 @@
+import pygame
+
+class FixedTimestep:
+    """Accumulates real frame time and converts it into a whole number of fixed simulation ticks."""
+
+    def __init__(self, tick_rate, max_steps):
+        self.dt = 1.0 / tick_rate
+        self.max_steps = max_steps
+        self.accumulator = 0.0
+        self.ticks = 0
+        self.dropped_time = 0.0
+
+    def advance(self, frame_time):
+        """Add frame_time seconds and return how many ticks to simulate this frame.
+
+        At most max_steps ticks run per frame; time beyond that is dropped instead of
+        carried over, so one slow frame can't snowball into ever longer catch-up frames.
+        """
+        self.accumulator += frame_time
+        steps = int(self.accumulator / self.dt)
+        if steps > self.max_steps:
+            self.dropped_time += (steps - self.max_steps) * self.dt
+            steps = self.max_steps
+            self.accumulator = steps * self.dt + self.accumulator % self.dt
+        self.accumulator -= steps * self.dt
+        self.ticks += steps
+        return steps
+
+    @property
+    def alpha(self):
+        """How far the current frame lies between the previous tick and the next one (0..1)."""
+        return self.accumulator / self.dt
+
+def interpolate_rect(rect, previous, alpha):
+    """Return a copy of rect placed alpha of the way from its previous top-left to its current one."""
+    x = previous[0] + (rect.x - previous[0]) * alpha
+    y = previous[1] + (rect.y - previous[1]) * alpha
+    return pygame.Rect(round(x), round(y), rect.width, rect.height)
@@ -1,30 +1,67 @@
+import sys
+from game.startup import StartupTimer, ImportTimer
+
+# --startup-profile reports everything from here to the first presented frame
+startup_timer = StartupTimer()
+import_timer = ImportTimer().install() if "--startup-profile" in sys.argv else None
+
+import argparse
 import pygame
 from screens.screen_manager import ScreenManager
 from auth.auth import Database
-from config.settings import Settings
+from config.settings import settings
+
+startup_timer.mark("imports")
 
 def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--startup-profile", action="store_true",
+                        help="print import and time-to-first-frame breakdown, then exit")
+    args = parser.parse_args()
+
     pygame.init()
-    settings = Settings()
+    startup_timer.mark("pygame.init")
     screen = pygame.display.set_mode((settings.screen_width, settings.screen_height))
     pygame.display.set_caption("2D Space Platformer")
+    startup_timer.mark("display")
     db = Database()
+    startup_timer.mark("database")
     screen_manager = ScreenManager(screen, settings, db)
-    
+    clock = pygame.time.Clock()
+    startup_timer.mark("screen manager")
+
     running = True
+    first_frame = True
     while running:
-        screen.fill((0, 0, 0))
-        for event in pygame.event.get():
+        if screen_manager.idle():
+            # Nothing on screen is changing: sleep until input arrives instead of redrawing
+            events = [pygame.event.wait(settings.idle_wait_ms)] + pygame.event.get()
+        else:
+            events = pygame.event.get()
+        for event in events:
             if event.type == pygame.QUIT:
                 running = False
             screen_manager.handle_input(event)
-        
-        screen_manager.update()
-        pygame.display.flip()
-        pygame.time.Clock().tick(settings.fps)
-    
+
+        dirty_rects = screen_manager.update()
+        if dirty_rects:
+            pygame.display.update(dirty_rects)
+        if first_frame:
+            first_frame = False
+            startup_timer.mark("first frame")
+            if args.startup_profile:
+                import_timer.uninstall()
+                from game.startup import print_report
+                within_budget = print_report(startup_timer, import_timer, settings.startup_budget_ms)
+                pygame.quit()
+                db.close()
+                return 0 if within_budget else 1
+        if not screen_manager.idle():
+            clock.tick(settings.fps)
+
     pygame.quit()
     db.close()
+    return 0
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    sys.exit(main())
\ No newline at end of file
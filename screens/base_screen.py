@@ -1,4 +1,47 @@
 import pygame
 
 def draw_screen(screen, bg):
-    screen.blit(bg, (0, 0))
\ No newline at end of file
+    screen.blit(bg, (0, 0))
+
+class Toasts:
+    """Messages that stay up for a while and fade out on their own, without blocking the screen."""
+
+    def __init__(self, font, duration=2000, fade=400):
+        self.font = font
+        self.duration = duration
+        self.fade = fade
+        self.messages = []
+
+    def show(self, text, color):
+        self.messages.append((self.font.render(text, True, color), pygame.time.get_ticks()))
+
+    def draw(self, screen, center):
+        now = pygame.time.get_ticks()
+        self.messages = [(surface, shown) for surface, shown in self.messages if now - shown < self.duration]
+        x, y = center
+        for surface, shown in reversed(self.messages):
+            surface.set_alpha(min(255, (self.duration - (now - shown)) * 255 // self.fade))
+            screen.blit(surface, surface.get_rect(center=(x, y)))
+            y += surface.get_height() + 6
+
+def pending_label(text):
+    """Text with a dot count that cycles over time, for work running in the background."""
+    return text + "." * (pygame.time.get_ticks() // 300 % 4)
+
+def pending_outcome(future, started, database, timeout_ms):
+    """(success, message) once a background login / signup is over, else None.
+
+    A request that raised, outlived timeout_ms or lost its writer thread comes
+    back as a failure, so the screen never waits on it forever.
+    """
+    if future.done():
+        try:
+            return future.result()
+        except Exception as e:
+            print(f"Database request failed: {e}")
+            return False, "Something went wrong, please try again"
+    if not database.writer.thread.is_alive() or pygame.time.get_ticks() - started >= timeout_ms:
+        # Drop it from the writer's queue if it has not started yet
+        future.cancel()
+        return False, "The database is not responding, please try again"
+    return None
@@ -1,14 +1,19 @@
 import pygame
+from game.text import text_cache
 
-def game_over_screen(screen, settings, score, db, logged_in_user):
-    font = pygame.font.Font(None, 36)
-    small_font = pygame.font.Font(None, 28)
+def game_over_screen(screen, settings, score, db, logged_in_user, controls=None, clock=None):
+    font = text_cache.font(None, 36)
+    small_font = text_cache.font(None, 28)
     running = True
+    clock = clock or pygame.time.Clock()
     
     print(f"Game over screen, logged_in_user: {logged_in_user}")
     
+    # Served from the in-memory leaderboard; fetched once, not every frame
+    top_players = db.leaderboard.top() if logged_in_user and logged_in_user.strip() else None
+    
     while running:
-        for event in pygame.event.get():
+        for event in (controls.events() if controls else pygame.event.get()):
             if event.type == pygame.QUIT:
                 return None
             if event.type == pygame.KEYDOWN:
@@ -20,17 +25,17 @@ def game_over_screen(screen, settings, score, db, logged_in_user):
         screen.fill((0, 0, 0))
         
         # Draw game over text (top)
-        title_text = font.render("Game Over!", True, (255, 0, 0))
+        title_text = text_cache.render(font, "Game Over!", (255, 0, 0))
         title_rect = title_text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 4 - 20))
         
-        score_text = font.render(f"Final Score: {score}", True, (255, 255, 255))
+        score_text = text_cache.render(font, f"Final Score: {score}", (255, 255, 255))
         score_rect = score_text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 4 + 20))
         
         # Draw instructions (bottom)
-        restart_text = font.render("Press R to Restart", True, (255, 255, 255))
+        restart_text = text_cache.render(font, "Press R to Restart", (255, 255, 255))
         restart_rect = restart_text.get_rect(center=(	settings.screen_width // 2, settings.screen_height - 60))
         
-        menu_text = font.render("Press M to Return to Menu", True, (255, 255, 255))
+        menu_text = text_cache.render(font, "Press M to Return to Menu", (255, 255, 255))
         menu_rect = menu_text.get_rect(center=(settings.screen_width // 2, settings.screen_height - 20))
         
         screen.blit(title_text, title_rect)
@@ -40,28 +45,27 @@ def game_over_screen(screen, settings, score, db, logged_in_user):
         
         # Draw leaderboard (middle)
         if logged_in_user is None:
-            login_text = font.render("Login to view Leaderboard", True, (255, 255, 255))
+            login_text = text_cache.render(font, "Login to view Leaderboard", (255, 255, 255))
             login_rect = login_text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 2))
             screen.blit(login_text, login_rect)
         
         else:
             if logged_in_user and logged_in_user.strip():
-                top_players = db.get_top_players()
                 if top_players:
-                    leaderboard_title = font.render("Leaderboard - Top 5", True, (255, 255, 0))
+                    leaderboard_title = text_cache.render(font, "Leaderboard - Top 5", (255, 255, 0))
                     leaderboard_title_rect = leaderboard_title.get_rect(center=(settings.screen_width // 2, settings.screen_height // 2 - 50))
                     screen.blit(leaderboard_title, leaderboard_title_rect)
                     
                     for i, (username, high_score) in enumerate(top_players):
-                        player_text = small_font.render(f"{i + 1}. {username}: {high_score}", True, (255, 255, 255))
+                        player_text = text_cache.render(small_font, f"{i + 1}. {username}: {high_score}", (255, 255, 255))
                         player_rect = player_text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 2 - 10 + i * 40))
                         screen.blit(player_text, player_rect)
                 else:
-                    no_data_text = font.render("No leaderboard data yet", True, (255, 255, 255))
+                    no_data_text = text_cache.render(font, "No leaderboard data yet", (255, 255, 255))
                     no_data_rect = no_data_text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 2))
                     screen.blit(no_data_text, no_data_rect)
         
         pygame.display.flip()
-        pygame.time.Clock().tick(settings.fps)
+        clock.tick(settings.fps)
     
     return "menu"
\ No newline at end of file
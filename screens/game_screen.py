@@ -2,63 +2,88 @@ import pygame
 import os
 import random
 from game.camera import Camera
-from game.enemy import EnemyCrab, EnemyLizard
+from game.enemy import ENEMY_TYPES, EnemyLizard, preload_enemy_assets
+from game.activation import EnemyActivation
 from game.level import Level
 from game.player import Player
-from game.projectile import Projectile
-from game.particle import Particle
+from game.prefetch import LevelPrefetcher
+from game.projectile import Projectile, ProjectilePool
+from game.tilemap import TilemapRenderer
+from game.assets import assets, AssetLoader, PRIORITY_BACKGROUND, PRIORITY_DECOR
+from game.audio import SoundManager
+from game.hud import Hud
+from game.parallax import ParallaxRenderer
+from game.text import text_cache
+from game.timestep import FixedTimestep
+from game.input import KeyboardInput
+from game.profiler import Profiler
+from game.render_queue import RenderQueue, LAYER_COLLECTIBLES, LAYER_ENTITIES, LAYER_PARTICLES, LAYER_HUD
+from game.particle import ParticleSystem
 from config.settings import Settings
 from screens.game_over import game_over_screen
+from screens.loading_screen import loading_screen
 
-def game_screen(screen, settings, db, logged_in_user, level_number=1):
+def game_screen(screen, settings, db, logged_in_user, level_number=1, controls=None, clock=None, profiler=None):
+    """Run the game until the player quits or the game ends.
+
+    controls, clock and profiler default to live keyboard input, a real
+    pygame clock and a disabled profiler; benchmarks pass scripted stand-ins.
+    """
     pygame.mixer.init()
-    clock = pygame.time.Clock()
+    clock = clock or pygame.time.Clock()
+    controls = controls or KeyboardInput()
+    profiler = profiler or Profiler(enabled=False, history=settings.profiler_history)
     
     def reset_level():
         """Reset level state, including player lives."""
-        nonlocal level, player, enemies, score, collectible_frame, collectible_timer, game_instance
+        nonlocal level, tilemap, player, enemies, score, collectible_frame, collectible_timer, game_instance, collectible_total
         level_file = os.path.join("levels", f"level{level_number}.json")
         if not os.path.exists(level_file):
             level_file = os.path.join("levels", "level1.json")
-        level = Level(level_file)
         
         game_instance = Game(settings)  # Reset lives and related state
+        # Anything prefetched holds enemies bound to the old Game
+        prefetcher.clear()
+        level, tilemap, enemies = build_level(level_file)
+        collectible_total = len(level.collectibles)
         player = Player(settings.screen_width // 2, 400, game_instance)
         
-        enemies.clear()
-        for enemy_rect, enemy_type in level.enemies:
-            if enemy_type == "walker":
-                enemies.append(EnemyCrab(enemy_rect.x, enemy_rect.y, [t[0] for t in level.physics_tiles], game_instance))
-            elif enemy_type == "shooter":
-                enemies.append(EnemyLizard(enemy_rect.x, enemy_rect.y, [t[0] for t in level.physics_tiles], game_instance))
-        
         score = 0
         collectible_frame = 0
         collectible_timer = 0
         camera.update(player.rect)
+        camera.snapshot()
         print(f"Level {level_number} restarted, lives reset to {game_instance.player_lives}")
 
     def load_next_level():
         """Load next level, maintaining score and lives."""
-        nonlocal level, player, enemies, collectible_frame, collectible_timer, level_number
+        nonlocal level, tilemap, player, enemies, collectible_frame, collectible_timer, level_number, collectible_total
         level_file = os.path.join("levels", f"level{level_number}.json")
         if not os.path.exists(level_file):
             level_file = os.path.join("levels", "level1.json")
-        level = Level(level_file)
         
+        enemies.despawn()
+        # Normally built during the fade, so this is a swap rather than a load
+        level, tilemap, enemies = prefetcher.take(level_file)
+        collectible_total = len(level.collectibles)
         player = Player(settings.screen_width // 2, 400, game_instance)  # Keep game_instance for lives
         
-        enemies.clear()
-        for enemy_rect, enemy_type in level.enemies:
-            if enemy_type == "walker":
-                enemies.append(EnemyCrab(enemy_rect.x, enemy_rect.y, [t[0] for t in level.physics_tiles], game_instance))
-            elif enemy_type == "shooter":
-                enemies.append(EnemyLizard(enemy_rect.x, enemy_rect.y, [t[0] for t in level.physics_tiles], game_instance))
-        
         collectible_frame = 0
         collectible_timer = 0
         camera.update(player.rect)
+        camera.snapshot()
         print(f"Transitioned to Level {level_number}, score: {score}, lives: {game_instance.player_lives}")
+        print(f"Level load on critical path: {prefetcher.last_wait_ms:.2f} ms (prefetched: {prefetcher.prefetched}, missed: {prefetcher.missed})")
+
+    def build_level(level_file):
+        """Load a level with its tile renderer and enemies; runs on the prefetch worker."""
+        new_level = Level(level_file)
+        return new_level, TilemapRenderer(new_level, tile_sprites, decor_sprites), EnemyActivation(new_level, game_instance)
+
+    def prefetch_next_level():
+        next_level_file = os.path.join("levels", f"level{level_number + 1}.json")
+        if os.path.exists(next_level_file):
+            prefetcher.request(next_level_file)
 
     # Load level (initial)
     level_file = os.path.join("levels", f"level{level_number}.json")
@@ -67,40 +92,52 @@ def game_screen(screen, settings, db, logged_in_user, level_number=1):
         level_file = os.path.join("levels", "level1.json")
     level = Level(level_file)
     
+    # Decode everything on worker threads behind a progress bar, most urgent first;
+    # the lookups below then come straight from the asset cache
+    loader = AssetLoader(assets)
+    for animations in [Player.ANIMATIONS, Projectile.ANIMATIONS] + [enemy_class.ANIMATIONS for enemy_class in ENEMY_TYPES.values()]:
+        for paths in animations.values():
+            loader.add_images(paths)
+    loader.add_images(settings.tile_images + settings.collectible_images)
+    loader.add_images([settings.heart_full_image, settings.heart_empty_image, os.path.join("Assets", "Shield", "Shield.png")], size=(32, 32))
+    loader.add_images([bg["file"] for bg in settings.background_layers], alpha=False, size=(settings.screen_width, 1080), priority=PRIORITY_BACKGROUND)
+    loader.add_images(settings.decor_images, priority=PRIORITY_DECOR)
+    loader.add_sounds(file for key, file in settings.audio_files.items() if key not in settings.streamed_audio)
+    if not loading_screen(screen, settings, loader, controls, clock):
+        return "menu"
+    
     # Load sprites and audio
-    backgrounds = [pygame.image.load(os.path.join(bg["file"])).convert() for bg in settings.background_layers]
-    for i in range(len(backgrounds)):
-        backgrounds[i] = pygame.transform.scale(backgrounds[i], (settings.screen_width, 1080))
-    tile_sprites = [pygame.image.load(file).convert_alpha() for file in settings.tile_images]
-    decor_sprites = [pygame.image.load(file).convert_alpha() for file in settings.decor_images]
-    collectible_sprites = [pygame.image.load(file).convert_alpha() for file in settings.collectible_images]
-    heart_full = pygame.image.load(settings.heart_full_image).convert_alpha()
-    heart_empty = pygame.image.load(settings.heart_empty_image).convert_alpha()
-    shield_image = pygame.image.load(os.path.join("Assets", "Shield", "Shield.png")).convert_alpha()
-    shield_image = pygame.transform.scale(shield_image, (32, 32))
-    sounds = {key: pygame.mixer.Sound(file) for key, file in settings.audio_files.items()}
+    parallax = ParallaxRenderer([(assets.image(bg["file"], alpha=False, size=(settings.screen_width, 1080)), bg["speed"]) for bg in settings.background_layers],
+                                settings.screen_width, settings.screen_height, settings.background_color)
+    tile_sprites = assets.frames(settings.tile_images)
+    decor_sprites = assets.frames(settings.decor_images)
+    collectible_sprites = assets.frames(settings.collectible_images)
+    shield_image = assets.image(os.path.join("Assets", "Shield", "Shield.png"), size=(32, 32))
+    audio = SoundManager()
     
     # Scale hearts
     heart_size = (32, 32)
-    heart_full = pygame.transform.scale(heart_full, heart_size)
-    heart_empty = pygame.transform.scale(heart_empty, heart_size)
+    heart_full = assets.image(settings.heart_full_image, size=heart_size)
+    heart_empty = assets.image(settings.heart_empty_image, size=heart_size)
+    preload_enemy_assets()
+    
+    # Static decor and tiles are baked into chunk surfaces as they come on screen
+    tilemap = TilemapRenderer(level, tile_sprites, decor_sprites)
     
     # Initialize game objects
     game_instance = Game(settings)
     player = Player(settings.screen_width // 2, 400, game_instance)
-    enemies = []
-    for enemy_rect, enemy_type in level.enemies:
-        if enemy_type == "walker":
-            enemies.append(EnemyCrab(enemy_rect.x, enemy_rect.y, [t[0] for t in level.physics_tiles], game_instance))
-        elif enemy_type == "shooter":
-            enemies.append(EnemyLizard(enemy_rect.x, enemy_rect.y, [t[0] for t in level.physics_tiles], game_instance))
+    enemies = EnemyActivation(level, game_instance)
+    collectible_total = len(level.collectibles)
+    prefetcher = LevelPrefetcher(build_level)
     camera = Camera(level.width, level.height, settings.screen_width, settings.screen_height)
     camera.update(player.rect)
+    camera.snapshot()
     
     score = 0
     running = True
-    font = pygame.font.Font(None, 36)
-    small_font = pygame.font.Font(None, 24)
+    font = text_cache.font(None, 36)
+    hud = Hud(heart_full, heart_empty)
     
     collectible_frame = 0
     collectible_animation_speed = 0.2
@@ -108,10 +145,16 @@ def game_screen(screen, settings, db, logged_in_user, level_number=1):
     
     # Screen shake variables
     shake_offset = pygame.Vector2(0, 0)
+    cull_margin = game_instance.shake_intensity + 1
     
     # Screen flash variables
     flash_surface = pygame.Surface((settings.screen_width, settings.screen_height), pygame.SRCALPHA)
     
+    # Batched drawing; particles are blitted from one shared solid surface
+    render_queue = RenderQueue()
+    particle_sprite = assets.solid(settings.particle_size, settings.particle_color)
+    transition_surface = pygame.Surface((settings.screen_width, settings.screen_height), pygame.SRCALPHA)
+    
     # Transition variables
     transition_alpha = 0
     transition_timer = 0
@@ -121,282 +164,299 @@ def game_screen(screen, settings, db, logged_in_user, level_number=1):
     message_timer = 0
     
     # Play background music and ambience
-    pygame.mixer.music.load(settings.audio_files["music"])
-    pygame.mixer.music.play(-1)
-    sounds["ambience"].play(-1)
+    audio.play_music()
+    audio.play_ambience()
+    
+    # Simulation runs at settings.tick_rate independently of the display frame rate
+    timestep = FixedTimestep(settings.tick_rate, settings.max_catchup_steps)
+    clock.tick()
     
     print(f"Game started, logged_in_user: {logged_in_user}")
     
     while running:
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                running = False
-            if event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_q:
+        with profiler.phase("input"):
+            for event in controls.events():
+                if event.type == pygame.QUIT:
                     running = False
-                elif event.key == pygame.K_r:
-                    reset_level()
-                elif event.key == pygame.K_f and game_instance.shield_cooldown <= 0:
-                    game_instance.shield_timer = 180
-                    game_instance.shield_active = True
-                    game_instance.shield_cooldown = 480
-                    print("Shield activated")
-        
-        # Check lose condition first
-        if game_instance.player_lives <= 0:
-            running = False
-            if logged_in_user and logged_in_user.strip():
-                user_id = db.get_user_id(logged_in_user)
-                if user_id:
-                    db.log_game_session(user_id, score, game_instance.lives_lost)
-                    db.update_score(logged_in_user, score)
-                    print(f"Score updated for {logged_in_user}: {score}")
-            result = game_over_screen(screen, settings, score, db, logged_in_user)
-            if result == "game":
-                return f"game:{1}"  # Restart at level 1
-            elif result == "menu" or result is None:
-                return "menu"
-        
-        # Game logic if player still has lives
-        if not transitioning and not endgame_message:
-            player.update([t[0] for t in level.physics_tiles])
-            if player.velocity.y < 0:
-                sounds["jump"].play()
-            if player.dashing and player.dash_timer == player.dash_duration - 1:
-                sounds["dash"].play()
+                if event.type == pygame.KEYDOWN:
+                    if event.key == pygame.K_q:
+                        running = False
+                    elif event.key == pygame.K_r:
+                        reset_level()
+                    elif event.key == pygame.K_f and game_instance.shield_cooldown <= 0:
+                        game_instance.shield_timer = 180
+                        game_instance.shield_active = True
+                        game_instance.shield_cooldown = 480
+                        print("Shield activated")
+                    elif event.key == pygame.K_F3:
+                        profiler.toggle()
+                    elif event.key == pygame.K_F4:
+                        profiler.capture(settings.profile_capture_frames)
+                    elif event.key == pygame.K_F5:
+                        profiler.export_trace()
+        
+        # Run the simulation at a fixed tick rate, however long the last frame took
+        steps = timestep.advance(clock.tick(settings.fps) / 1000)
+        with profiler.phase("update"):
+            for _ in range(steps):
+                player.snapshot()
+                for enemy in enemies:
+                    enemy.snapshot()
+                camera.snapshot()
+                audio.update(camera.view_rect())
+                
+                # Check lose condition first
+                if game_instance.player_lives <= 0:
+                    running = False
+                    if logged_in_user and logged_in_user.strip():
+                        db.log_game_session(logged_in_user, score, game_instance.lives_lost)
+                        db.update_score(logged_in_user, score)
+                        print(f"Score updated for {logged_in_user}: {score}")
+                    prefetcher.shutdown()
+                    result = game_over_screen(screen, settings, score, db, logged_in_user, controls, clock)
+                    if result == "game":
+                        return f"game:{1}"  # Restart at level 1
+                    elif result == "menu" or result is None:
+                        return "menu"
+                
+                # Game logic if player still has lives
+                if not transitioning and not endgame_message:
+                    respawned = False
+                    with profiler.phase("player"):
+                        player.update(level, controls.pressed())
+                    if player.jumped:
+                        audio.play("jump")
+                    if player.dashing and player.dash_timer == player.dash_duration - 1:
+                        audio.play("dash")
+                    
+                    if game_instance.damage_cooldown > 0:
+                        game_instance.damage_cooldown -= 1
+                    if game_instance.shield_timer > 0:
+                        game_instance.shield_timer -= 1
+                        if game_instance.shield_timer <= 0:
+                            game_instance.shield_active = False
+                            print("Shield deactivated")
+                    if game_instance.shield_cooldown > 0:
+                        game_instance.shield_cooldown -= 1
+                    
+                    with profiler.phase("enemies"):
+                        # Only enemies near the view are updated here; the rest are moved along their patrols
+                        for enemy in enemies.update(camera.view_rect(), player):
+                            enemy.update(level, player)
+                            if isinstance(enemy, EnemyLizard) and enemy.shoot_timer == settings.shoot_cooldown - 1:
+                                audio.play("shoot", enemy.rect.center)
+                            if player.rect.colliderect(enemy.rect):
+                                if player.velocity.y > 0 and enemy.rect.top < player.rect.bottom <= enemy.rect.top + enemy.rect.height and game_instance.damage_cooldown <= 0:
+                                    audio.play("enemy_death", enemy.rect.center)
+                                    player.spawn_particles(enemy.rect.centerx, enemy.rect.centery)
+                                    enemy.despawn()
+                                    enemies.remove(enemy)
+                                    score += settings.score_per_enemy
+                                    print(f"Enemy ({type(enemy).__name__}) defeated by jump at ({enemy.rect.x}, {enemy.rect.y}), player bottom: {player.rect.bottom}, enemy top: {enemy.rect.top}, score: {score}")
+                                    player.velocity.y = -5
+                                elif player.dashing and game_instance.damage_cooldown <= 0:
+                                    audio.play("enemy_death", enemy.rect.center)
+                                    player.spawn_particles(enemy.rect.centerx, enemy.rect.centery)
+                                    enemy.despawn()
+                                    enemies.remove(enemy)
+                                    score += settings.score_per_enemy
+                                    print(f"Enemy ({type(enemy).__name__}) defeated by dash at ({enemy.rect.x}, {enemy.rect.y}), dashing: {player.dashing}, score: {score}")
+                                elif game_instance.damage_cooldown <= 0:
+                                    game_instance.take_damage(player)
+                                    audio.play("hurt")
+                                    player.rect.x = settings.screen_width // 2
+                                    player.rect.y = 400
+                                    # Interpolate from the respawn point, not across the level
+                                    player.snapshot()
+                                    respawned = True
+                                    print(f"Player respawned at ({player.rect.x}, {player.rect.y}) due to enemy ({type(enemy).__name__}) contact")
+                    
+                    with profiler.phase("collision"):
+                        for collectible in level.collectibles[:]:
+                            if player.rect.colliderect(collectible[0]):
+                                audio.play("coin")
+                                level.collectibles.remove(collectible)
+                                score += settings.score_per_collectible
+                                if len(level.collectibles) <= collectible_total * (1 - settings.prefetch_collected_fraction):
+                                    prefetch_next_level()
+                        
+                        for enemy in enemies:
+                            if isinstance(enemy, EnemyLizard):
+                                for proj in enemy.projectiles[:]:
+                                    if proj.rect.colliderect(player.rect) and game_instance.damage_cooldown <= 0:
+                                        if game_instance.shield_active:
+                                            proj.spawn_particles(game_instance.particles)
+                                            enemy.release_projectile(proj)
+                                            print(f"Shield blocked fireball at ({proj.rect.x}, {proj.rect.y})")
+                                        else:
+                                            game_instance.take_damage(player)
+                                            audio.play("hurt")
+                                            player.rect.x = settings.screen_width // 2
+                                            player.rect.y = 400
+                                            player.snapshot()
+                                            respawned = True
+                                            enemy.release_projectile(proj)
+                                            print(f"Player respawned at ({player.rect.x}, {player.rect.y}) due to projectile hit")
+                    
+                    game_instance.particles.update()
+                    camera.update(player.rect)
+                    if respawned:
+                        camera.snapshot()
+                    
+                    collectible_timer += collectible_animation_speed
+                    if collectible_timer >= 1:
+                        collectible_frame = (collectible_frame + 1) % len(collectible_sprites)
+                        collectible_timer = 0
+                
+                # Screen shake update
+                if game_instance.shake_duration > 0:
+                    shake_offset = pygame.Vector2(
+                        random.uniform(-game_instance.shake_intensity, game_instance.shake_intensity),
+                        random.uniform(-game_instance.shake_intensity, game_instance.shake_intensity)
+                    )
+                    game_instance.shake_duration -= 1
+                    print(f"Shake active: duration={game_instance.shake_duration}, offset={shake_offset}")
+                else:
+                    shake_offset = pygame.Vector2(0, 0)
+                
+                # Screen flash update
+                if game_instance.flash_alpha > 0:
+                    game_instance.flash_alpha -= game_instance.flash_max_alpha / game_instance.flash_duration
+                    game_instance.flash_alpha = max(0, game_instance.flash_alpha)
+                    flash_surface.fill((255, 0, 0, int(game_instance.flash_alpha)))
+                    print(f"Flash active: alpha={game_instance.flash_alpha}")
+                
+                # Transition update
+                if transitioning:
+                    transition_timer += 1
+                    if transition_timer <= 60:
+                        transition_alpha = (transition_timer / 60) * 255
+                    else:
+                        transition_alpha = 255 - ((transition_timer - 60) / 60) * 255
+                    if transition_timer >= 120:
+                        transitioning = False
+                        transition_timer = 0
+                        transition_alpha = 0
+                        if next_level_number:
+                            level_number = next_level_number
+                            load_next_level()
+                            next_level_number = None
+                        else:
+                            endgame_message = True
+                            message_timer = 180
+                
+                # Endgame message update
+                if endgame_message:
+                    message_timer -= 1
+                    if message_timer <= 0:
+                        running = False
+                        if logged_in_user and logged_in_user.strip():
+                            db.log_game_session(logged_in_user, score, game_instance.lives_lost)
+                            db.update_score(logged_in_user, score)
+                            print(f"Score updated for {logged_in_user}: {score}")
+                        prefetcher.shutdown()
+                        result = game_over_screen(screen, settings, score, db, logged_in_user, controls, clock)
+                        if result == "game":
+                            return f"game:{1}"
+                        elif result == "menu" or result is None:
+                            return "menu"
+                
+                # Check level completion
+                if not level.collectibles and not transitioning and not endgame_message:
+                    audio.play("level_complete")
+                    next_level_file = os.path.join("levels", f"level{level_number + 1}.json")
+                    if os.path.exists(next_level_file):
+                        transitioning = True
+                        next_level_number = level_number + 1
+                        prefetcher.request(next_level_file)
+                    
+                    else:
+                        transitioning = True
+                        next_level_number = None
+                        audio.stop_background()
+        
+        # Render between the last two simulation states
+        with profiler.phase("world"):
+            alpha = timestep.alpha
+            camera.interpolate(alpha)
             
-            if game_instance.damage_cooldown > 0:
-                game_instance.damage_cooldown -= 1
-            if game_instance.shield_timer > 0:
-                game_instance.shield_timer -= 1
-                if game_instance.shield_timer <= 0:
-                    game_instance.shield_active = False
-                    print("Shield deactivated")
-            if game_instance.shield_cooldown > 0:
-                game_instance.shield_cooldown -= 1
+            # Draw: everything is queued per layer and submitted in one batched blit per layer
+            render_queue.begin_frame()
+            # Backgrounds go straight to the screen; every queued layer is flushed over them
+            parallax.draw(screen, camera.render_offset, shake_offset)
             
-            for enemy in enemies[:]:
-                enemy.update([t[0] for t in level.physics_tiles], player)
-                if isinstance(enemy, EnemyLizard) and enemy.shoot_timer == settings.shoot_cooldown - 1:
-                    sounds["shoot"].play()
-                if player.rect.colliderect(enemy.rect):
-                    if player.velocity.y > 0 and enemy.rect.top < player.rect.bottom <= enemy.rect.top + enemy.rect.height and game_instance.damage_cooldown <= 0:
-                        sounds["enemy_death"].play()
-                        player.spawn_particles(enemy.rect.centerx, enemy.rect.centery)
-                        enemies.remove(enemy)
-                        score += settings.score_per_enemy
-                        print(f"Enemy ({type(enemy).__name__}) defeated by jump at ({enemy.rect.x}, {enemy.rect.y}), player bottom: {player.rect.bottom}, enemy top: {enemy.rect.top}, score: {score}")
-                        player.velocity.y = -5
-                    elif player.dashing and game_instance.damage_cooldown <= 0:
-                        sounds["enemy_death"].play()
-                        player.spawn_particles(enemy.rect.centerx, enemy.rect.centery)
-                        enemies.remove(enemy)
-                        score += settings.score_per_enemy
-                        print(f"Enemy ({type(enemy).__name__}) defeated by dash at ({enemy.rect.x}, {enemy.rect.y}), dashing: {player.dashing}, score: {score}")
-                    elif game_instance.damage_cooldown <= 0:
-                        game_instance.take_damage(player)
-                        sounds["hurt"].play()
-                        player.rect.x = settings.screen_width // 2
-                        player.rect.y = 400
-                        print(f"Player respawned at ({player.rect.x}, {player.rect.y}) due to enemy ({type(enemy).__name__}) contact")
+            # Static world comes from pre-baked chunks; collectibles stay dynamic on top
+            camera.begin_frame()
+            view = camera.view_rect(cull_margin)
+            tilemap.draw(render_queue, camera, shake_offset, cull_margin)
+            visible_collectibles = camera.count_culled([c for c in level.collectibles if view.colliderect(c[0])], len(level.collectibles))
             
-            for collectible in level.collectibles[:]:
-                if player.rect.colliderect(collectible[0]):
-                    sounds["coin"].play()
-                    level.collectibles.remove(collectible)
-                    score += settings.score_per_collectible
+            sprite = collectible_sprites[collectible_frame]
+            for coll, index in visible_collectibles:
+                adjusted_rect = camera.apply(coll).move(shake_offset.x, shake_offset.y)
+                render_queue.add(LAYER_COLLECTIBLES, sprite, adjusted_rect)
+            
+            player.draw(render_queue, camera, alpha)
+            
+            if game_instance.shield_active:
+                shield_rect = camera.apply(player.render_rect(alpha))
+                render_queue.add(LAYER_ENTITIES, shield_image, shield_rect)
+            
+            render_queue.extend(LAYER_PARTICLES, game_instance.particles.blit_sequence(
+                particle_sprite, shake_offset.x - camera.render_offset.x, shake_offset.y - camera.render_offset.y))
             
             for enemy in enemies:
+                enemy.draw(render_queue, camera, alpha)
                 if isinstance(enemy, EnemyLizard):
-                    for proj in enemy.projectiles[:]:
-                        if proj.rect.colliderect(player.rect) and game_instance.damage_cooldown <= 0:
-                            if game_instance.shield_active:
-                                proj.spawn_particles()
-                                enemy.projectiles.remove(proj)
-                                print(f"Shield blocked fireball at ({proj.rect.x}, {proj.rect.y})")
-                            else:
-                                game_instance.take_damage(player)
-                                sounds["hurt"].play()
-                                player.rect.x = settings.screen_width // 2
-                                player.rect.y = 400
-                                enemy.projectiles.remove(proj)
-                                print(f"Player respawned at ({player.rect.x}, {player.rect.y}) due to projectile hit")
-            
-            camera.update(player.rect)
+                    enemy.draw_projectiles(render_queue, camera, alpha)
             
-            collectible_timer += collectible_animation_speed
-            if collectible_timer >= 1:
-                collectible_frame = (collectible_frame + 1) % len(collectible_sprites)
-                collectible_timer = 0
+            render_queue.flush(screen, LAYER_PARTICLES)
         
-        # Screen shake update
-        if game_instance.shake_duration > 0:
-            shake_offset = pygame.Vector2(
-                random.uniform(-game_instance.shake_intensity, game_instance.shake_intensity),
-                random.uniform(-game_instance.shake_intensity, game_instance.shake_intensity)
-            )
-            game_instance.shake_duration -= 1
-            print(f"Shake active: duration={game_instance.shake_duration}, offset={shake_offset}")
-        else:
-            shake_offset = pygame.Vector2(0, 0)
-        
-        # Screen flash update
-        if game_instance.flash_alpha > 0:
-            game_instance.flash_alpha -= game_instance.flash_max_alpha / game_instance.flash_duration
-            game_instance.flash_alpha = max(0, game_instance.flash_alpha)
-            flash_surface.fill((255, 0, 0, int(game_instance.flash_alpha)))
-            print(f"Flash active: alpha={game_instance.flash_alpha}")
-        
-        # Transition update
-        if transitioning:
-            transition_timer += 1
-            if transition_timer <= 60:
-                transition_alpha = (transition_timer / 60) * 255
-            else:
-                transition_alpha = 255 - ((transition_timer - 60) / 60) * 255
-            if transition_timer >= 120:
-                transitioning = False
-                transition_timer = 0
-                transition_alpha = 0
-                if next_level_number:
-                    level_number = next_level_number
-                    load_next_level()
-                    next_level_number = None
-                else:
-                    endgame_message = True
-                    message_timer = 180
-        
-        # Endgame message update
-        if endgame_message:
-            message_timer -= 1
-            if message_timer <= 0:
-                running = False
-                if logged_in_user and logged_in_user.strip():
-                    user_id = db.get_user_id(logged_in_user)
-                    if user_id:
-                        db.log_game_session(user_id, score, game_instance.lives_lost)
-                        db.update_score(logged_in_user, score)
-                        print(f"Score updated for {logged_in_user}: {score}")
-                result = game_over_screen(screen, settings, score, db, logged_in_user)
-                if result == "game":
-                    return f"game:{1}"
-                elif result == "menu" or result is None:
-                    return "menu"
-        
-        # Draw
-        screen.fill(settings.background_color)
-        
-        for i, bg in enumerate(backgrounds):
-            parallax_offset = camera.apply_parallax(i)
-            bg_width = bg.get_width()
-            bg_height = bg.get_height()
-            start_x = -(parallax_offset.x % bg_width) + shake_offset.x
-            y_offset = -(parallax_offset.y % bg_height) - (bg_height - settings.screen_height) // 2 + shake_offset.y
-            num_tiles_x = int(settings.screen_width / bg_width) + 2
-            num_tiles_y = int(settings.screen_height / bg_height) + 2
-            for j in range(num_tiles_x):
-                for k in range(num_tiles_y):
-                    x_pos = start_x + (j * bg_width)
-                    y_pos = y_offset + (k * bg_height)
-                    screen.blit(bg, (x_pos, y_pos))
-        
-        for dec, index in level.decorative_tiles:
-            sprite = decor_sprites[index]
-            adjusted_rect = camera.apply(dec).move(shake_offset.x, shake_offset.y)
-            screen.blit(sprite, adjusted_rect)
-        
-        for tile, index in level.physics_tiles:
-            sprite = tile_sprites[index]
-            adjusted_rect = camera.apply(tile).move(shake_offset.x, shake_offset.y)
-            screen.blit(sprite, adjusted_rect)
-        
-        for coll, index in level.collectibles:
-            sprite = collectible_sprites[collectible_frame]
-            adjusted_rect = camera.apply(coll).move(shake_offset.x, shake_offset.y)
-            screen.blit(sprite, adjusted_rect)
-        
-        player.draw(screen, camera)
-        
-        if game_instance.shield_active:
-            shield_rect = camera.apply(player.rect)
-            screen.blit(shield_image, shield_rect)
-        
-        for particle in player.particles:
-            adjusted_particle_rect = camera.apply(particle.rect).move(shake_offset.x, shake_offset.y)
-            pygame.draw.rect(screen, settings.particle_color, adjusted_particle_rect)
-        
-        for enemy in enemies:
-            enemy.draw(screen, camera)
-            if isinstance(enemy, EnemyLizard):
-                enemy.draw_projectiles(screen, camera)
-        
-        if game_instance.flash_alpha > 0:
-            screen.blit(flash_surface, (0, 0))
-        
-        # HUD
-        level_text = font.render(f"Level {level_number}", True, settings.text_color)
-        screen.blit(level_text, (10, 10))
-        
-        score_text = font.render(f"Score: {score}", True, settings.text_color)
-        score_rect = score_text.get_rect(center=(settings.screen_width // 2, 20))
-        screen.blit(score_text, score_rect)
-        
-        for i in range(3):
-            if i < game_instance.player_lives:
-                screen.blit(heart_full, (settings.screen_width - 40 - i * 40, 10))
-            else:
-                screen.blit(heart_empty, (settings.screen_width - 40 - i * 40, 10))
-        
-        dash_status = "Dash: Ready" if player.dash_cooldown_timer <= 0 else f"Dash: {player.dash_cooldown_timer // 60}s"
-        dash_text = small_font.render(dash_status, True, settings.text_color)
-        dash_rect = dash_text.get_rect(center=(settings.screen_width // 2 - 55, 50))
-        screen.blit(dash_text, dash_rect)
-        
-        shield_status = "Shield: Ready" if game_instance.shield_cooldown <= 0 else f"Shield: {game_instance.shield_cooldown // 60}s"
-        shield_text = small_font.render(shield_status, True, settings.text_color)
-        shield_rect = shield_text.get_rect(center=(settings.screen_width // 2 + 55, 50))
-        screen.blit(shield_text, shield_rect)
-        
-        # Draw transition overlay
-        if transitioning:
-            transition_surface = pygame.Surface((settings.screen_width, settings.screen_height), pygame.SRCALPHA)
-            transition_surface.fill((0, 0, 0, int(transition_alpha)))
-            screen.blit(transition_surface, (0, 0))
-        
-        # Draw endgame message
-        if endgame_message:
-            sounds["level_complete"].play()
-
-            message_text = font.render("All levels completed", True, settings.text_color)
-            message_rect = message_text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 2))
-            screen.blit(message_text, message_rect)
-        
-        # Check level completion
-        if not level.collectibles and not transitioning and not endgame_message:
-            sounds["level_complete"].play()
-            next_level_file = os.path.join("levels", f"level{level_number + 1}.json")
-            if os.path.exists(next_level_file):
-                transitioning = True
-                next_level_number = level_number + 1
-                
-            else:
-                transitioning = True
-                next_level_number = None
-                pygame.mixer.music.stop()
-                sounds["ambience"].stop()
-        
-        pygame.display.flip()
-        clock.tick(settings.fps)
+        with profiler.phase("hud"):
+            if game_instance.flash_alpha > 0:
+                render_queue.add(LAYER_HUD, flash_surface, (0, 0))
+            
+            # HUD is only re-rendered when one of these values changes
+            dash_status = "Dash: Ready" if player.dash_cooldown_timer <= 0 else f"Dash: {player.dash_cooldown_timer // 60}s"
+            shield_status = "Shield: Ready" if game_instance.shield_cooldown <= 0 else f"Shield: {game_instance.shield_cooldown // 60}s"
+            render_queue.add(LAYER_HUD, hud.update(level_number, score, game_instance.player_lives, dash_status, shield_status), (0, 0))
+            
+            # Draw transition overlay
+            if transitioning:
+                transition_surface.fill((0, 0, 0, int(transition_alpha)))
+                render_queue.add(LAYER_HUD, transition_surface, (0, 0))
+            
+            # Draw endgame message
+            if endgame_message:
+                message_text = text_cache.render(font, "All levels completed", settings.text_color)
+                message_rect = message_text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 2))
+                render_queue.add(LAYER_HUD, message_text, message_rect)
+            
+            render_queue.flush(screen)
+            if profiler.enabled:
+                sfx = audio.stats()
+                text_stats = text_cache.stats()
+                profiler.draw_overlay(screen, {"drawn": camera.drawn, "culled": camera.culled, "bg px": parallax.pixels,
+                                                "blits": f"{render_queue.submitted} in {render_queue.batches} batches",
+                                                "enemies full/patrol/asleep": f"{enemies.full}/{enemies.coarse}/{enemies.asleep}",
+                                                "sfx played/limited/stolen/culled/dropped": f"{sfx['played']}/{sfx['rate_limited']}/{sfx['stolen']}/{sfx['culled']}/{sfx['dropped']}",
+                                                "hud redraws": hud.redraws,
+                                                "text cache hits/misses": f"{text_stats['hits']}/{text_stats['misses']} ({text_stats['cached']} cached)"})
+        
+        with profiler.phase("present"):
+            pygame.display.flip()
+        profiler.end_frame()
     
-    pygame.mixer.music.stop()
-    sounds["ambience"].stop()
+    audio.stop()
+    print(f"Culled {camera.culled_total} off-screen draw calls")
+    print(f"Asset registry: {assets.stats()}")
+    print(f"Projectile pool: {game_instance.projectiles.stats()}")
     
     if logged_in_user and logged_in_user.strip():
-        user_id = db.get_user_id(logged_in_user)
-        if user_id:
-            db.log_game_session(user_id, score, game_instance.lives_lost)
-            db.update_score(logged_in_user, score)
-            print(f"Score updated for {logged_in_user}: {score} on quit")
+        db.log_game_session(logged_in_user, score, game_instance.lives_lost)
+        db.update_score(logged_in_user, score)
+        print(f"Score updated for {logged_in_user}: {score} on quit")
+    prefetcher.shutdown()
     return "menu"
 
 class Game:
@@ -413,6 +473,8 @@ class Game:
         self.shield_active = False
         self.shield_timer = 0
         self.shield_cooldown = 0
+        self.particles = ParticleSystem()
+        self.projectiles = ProjectilePool()
         
     def take_damage(self, player):
         if self.damage_cooldown <= 0:
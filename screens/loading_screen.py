@@ -0,0 +1,30 @@
+import pygame
+
+def loading_screen(screen, settings, loader, controls=None, clock=None):
+    """Draw a progress bar while loader decodes assets in the background.
+
+    Returns False if the window was closed before loading finished.
+    """
+    clock = clock or pygame.time.Clock()
+    font = pygame.font.Font(None, 36)
+    bar = pygame.Rect(0, 0, settings.screen_width // 2, 24)
+    bar.center = (settings.screen_width // 2, settings.screen_height // 2 + 30)
+
+    loader.start()
+    while not loader.done:
+        for event in (controls.events() if controls else pygame.event.get()):
+            if event.type == pygame.QUIT:
+                loader.cancel()
+                return False
+
+        progress = loader.pump()
+
+        screen.fill((0, 0, 0))
+        text = font.render(f"Loading... {int(progress * 100)}%", True, (255, 255, 255))
+        screen.blit(text, text.get_rect(center=(settings.screen_width // 2, settings.screen_height // 2 - 10)))
+        pygame.draw.rect(screen, (255, 255, 255), bar, 2)
+        pygame.draw.rect(screen, (255, 255, 0), (bar.x + 4, bar.y + 4, int((bar.width - 8) * progress), bar.height - 8))
+        pygame.display.flip()
+        clock.tick(settings.fps)
+
+    return True
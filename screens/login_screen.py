@@ -1,26 +1,61 @@
 import pygame
-from screens.base_screen import draw_screen
+from screens.base_screen import draw_screen, Toasts, pending_label, pending_outcome
+from game.assets import assets
 
 class LoginScreen:
     def __init__(self, screen, settings, database):
         self.screen = screen
         self.settings = settings
         self.database = database
-        self.bg = pygame.image.load("./Assets/Background/login.png")
+        self.bg = assets.image("./Assets/Background/login.png", alpha=False)
         self.username = ""
         self.password = ""
         self.username_active = False
         self.password_active = False
-        self.message = ""
-        self.success = False
+        self.pending = None
+        self.pending_since = 0
+        self.proceed = None
 
         self.font = pygame.font.Font(None, 32)
+        self.toasts = Toasts(self.font)
         
         self.username_rect = pygame.Rect(262, 192, 438, 45)
         self.password_rect = pygame.Rect(262, 276, 438, 45)
+        self.message_rect = pygame.Rect(0, self.password_rect.y + 50, self.screen.get_width(), 100)
         self.login_button_rect = pygame.Rect(375, 376, 211, 55)
         self.sign_up_button_rect = pygame.Rect(375, 457, 211, 55)
 
+    def submit(self):
+        """Start checking the credentials on the database worker; the screen keeps running."""
+        if self.pending is None and self.proceed is None:
+            self.pending = self.database.login_user_async(self.username, self.password)
+            self.pending_since = pygame.time.get_ticks()
+
+    def update(self):
+        """Pick up a finished login; returns where to go next, like handle_input."""
+        outcome = None if self.pending is None else pending_outcome(self.pending, self.pending_since, self.database, self.settings.auth_timeout_ms)
+        if outcome is not None:
+            success, message = outcome
+            self.pending = None
+            self.toasts.show(message, (0, 255, 0) if success else (255, 0, 0))
+            if success:
+                # Leave the success message up briefly before moving on
+                self.proceed = (pygame.time.get_ticks() + self.settings.auth_success_hold_ms, self.username)
+                self.username = ""
+                self.password = ""
+        if self.proceed is not None and pygame.time.get_ticks() >= self.proceed[0]:
+            logged_username = self.proceed[1]
+            self.proceed = None
+            return "game", logged_username
+        return None
+
+    def animating(self):
+        return self.pending is not None or self.proceed is not None or bool(self.toasts.messages)
+
+    def changing_rects(self):
+        """The only parts of the screen that change while it is up."""
+        return [self.username_rect, self.password_rect, self.message_rect]
+
     def handle_input(self, event):
         if event.type == pygame.QUIT:
             return "quit"
@@ -33,19 +68,7 @@ class LoginScreen:
                 self.password_active = True
                 self.username_active = False
             elif self.login_button_rect.collidepoint(event.pos):
-                self.success, self.message = self.database.login_user(self.username, self.password)
-                if self.success:
-                    logged_username = self.username  
-                    self.username = ""
-                    self.password = ""
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
-                    return "game", logged_username  
-                else:
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
+                self.submit()
             
             elif self.sign_up_button_rect.collidepoint(event.pos):
                 return "signup"
@@ -57,19 +80,7 @@ class LoginScreen:
                 elif self.password_active:
                     self.password = self.password[:-1]
             elif event.key == pygame.K_RETURN or event.key == pygame.K_KP_ENTER:
-                self.success, self.message = self.database.login_user(self.username, self.password)
-                if self.success:
-                    logged_username = self.username  
-                    self.username = ""
-                    self.password = ""
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
-                    return "game", logged_username 
-                else:
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
+                self.submit()
             else:
                 if self.username_active:
                     self.username += event.unicode
@@ -85,9 +96,9 @@ class LoginScreen:
         password_surface = self.font.render("*" * len(self.password), True, (255, 255, 255))
         self.screen.blit(password_surface, (self.password_rect.x + 20, self.password_rect.y + 10))
         
-        if self.message:
-            message_color = (0, 255, 0) if self.success else (255, 0, 0)
-            message_surface = self.font.render(self.message, True, message_color)
-            message_rect = message_surface.get_rect(center=(self.screen.get_width() // 2, self.password_rect.y + 70))
-            self.screen.blit(message_surface, message_rect)
-            self.message = ""
\ No newline at end of file
+        message_center = (self.screen.get_width() // 2, self.password_rect.y + 70)
+        if self.pending is not None:
+            pending_surface = self.font.render(pending_label("Logging in"), True, (255, 255, 255))
+            self.screen.blit(pending_surface, pending_surface.get_rect(midleft=(message_center[0] - 60, message_center[1])))
+        else:
+            self.toasts.draw(self.screen, message_center)
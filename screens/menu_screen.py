@@ -1,8 +1,10 @@
 import pygame 
 from screens.base_screen import draw_screen
+from game.assets import assets
 
-menu_screen_bg = pygame.image.load("./Assets/Background/main.png")
+# Decoded on first draw, not at import
+MENU_SCREEN_BG = "./Assets/Background/main.png"
 
 # play_btn_rect = pygame.Rect(402, 345, 156, 44)
 def menu_screen(screen):
-    draw_screen(screen, menu_screen_bg)
+    draw_screen(screen, assets.image(MENU_SCREEN_BG, alpha=False))
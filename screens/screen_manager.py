@@ -1,25 +1,47 @@
 import pygame
-from screens.menu_screen import menu_screen
-from screens.second_menu_screen import second_menu_screen
-from screens.login_screen import LoginScreen
-from screens.signup_screen import SignupScreen
-from screens.game_screen import game_screen
+
+# The OS may have drawn over the window; the whole frame has to be presented again
+EXPOSE_EVENTS = {getattr(pygame, name) for name in ("WINDOWEXPOSED", "VIDEOEXPOSE", "WINDOWRESTORED") if hasattr(pygame, name)}
+
+def _menu_screen(manager):
+    from screens.menu_screen import menu_screen
+    return menu_screen
+
+def _second_menu_screen(manager):
+    from screens.second_menu_screen import second_menu_screen
+    return second_menu_screen
+
+def _login_screen(manager):
+    from screens.login_screen import LoginScreen
+    return LoginScreen(manager.screen, manager.settings, manager.db)
+
+def _signup_screen(manager):
+    from screens.signup_screen import SignupScreen
+    return SignupScreen(manager.screen, manager.settings, manager.db)
+
+def _game_screen(manager):
+    return manager.run_game
 
 class ScreenManager:
+    # Screens are imported and built the first time they're navigated to
+    FACTORIES = {
+        "menu": _menu_screen,
+        "second_menu": _second_menu_screen,
+        "login": _login_screen,
+        "signup": _signup_screen,
+        "game": _game_screen,
+    }
+
     def __init__(self, screen, settings, db):
         self.screen = screen
         self.settings = settings
         self.current_screen = "menu"
         self.db = db
         self.logged_in_user = None
-        
-        self.screens = {
-            "menu": menu_screen,
-            "second_menu": second_menu_screen,
-            "login": LoginScreen(screen, settings, self.db),
-            "signup": SignupScreen(screen, settings, self.db),
-            "game": lambda screen: game_screen(screen, self.settings, self.db, self.logged_in_user, level_number=1),
-        }
+        self.screens = {}
+        # Static screens are only redrawn when something on them changes
+        self.full_redraw = True
+        self.input_dirty = False
         
         self.buttons = {
             "menu": [(402, 345, 156, 44, "second_menu")],
@@ -44,25 +66,30 @@ class ScreenManager:
             elif isinstance(new_screen, str) and ":" in new_screen:
                 screen_name, level = new_screen.split(":")
                 if screen_name == "game":
-                    self.screens["game"] = lambda screen: game_screen(screen, self.settings, self.db, self.logged_in_user, level_number=int(level))
+                    self.screens["game"] = lambda screen: self.run_game(screen, level_number=int(level))
                     self.current_screen = "game"
-            elif new_screen in self.screens:
+            elif new_screen in self.FACTORIES:
                 self.current_screen = new_screen
+            self.full_redraw = True
             # print(f"Changed screen to {self.current_screen}, logged_in_user: {self.logged_in_user}")
     
+    def get_screen(self, name):
+        screen = self.screens.get(name)
+        if screen is None:
+            screen = self.screens[name] = self.FACTORIES[name](self)
+        return screen
+    
+    def run_game(self, screen, level_number=1):
+        from screens.game_screen import game_screen
+        return game_screen(screen, self.settings, self.db, self.logged_in_user, level_number=level_number)
+    
     def handle_input(self, event):
+        if event.type in EXPOSE_EVENTS:
+            self.full_redraw = True
         if self.current_screen in ["login", "signup"]:
-            result = self.screens[self.current_screen].handle_input(event)
-            if result:
-                if isinstance(result, tuple) and result[0] == "game":
-                    self.logged_in_user = result[1]  # Set from tuple
-                    print(f"Logged in as {self.logged_in_user} from {self.current_screen}")
-                    self.change_screen("game")
-                elif isinstance(result, str):
-                    if result == "game" and self.current_screen == "signup":
-                        self.logged_in_user = self.screens["signup"].username
-                        print(f"Logged in as {self.logged_in_user} from signup")
-                    self.change_screen(result)
+            if event.type in (pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN):
+                self.input_dirty = True
+            self.handle_form_result(self.get_screen(self.current_screen).handle_input(event))
         else:
             if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
                 for idx, (x, y, w, h, next_screen) in enumerate(self.buttons.get(self.current_screen, [])):
@@ -74,10 +101,49 @@ class ScreenManager:
                         self.change_screen(next_screen)
                         break
     
+    def handle_form_result(self, result):
+        if result:
+            if isinstance(result, tuple) and result[0] == "game":
+                self.logged_in_user = result[1]  # Set from tuple
+                print(f"Logged in as {self.logged_in_user} from {self.current_screen}")
+                self.change_screen("game")
+            elif isinstance(result, str):
+                if result == "game" and self.current_screen == "signup":
+                    self.logged_in_user = self.get_screen("signup").username
+                    print(f"Logged in as {self.logged_in_user} from signup")
+                self.change_screen(result)
+    
+    def idle(self):
+        """True when the current screen would draw nothing new until input arrives."""
+        if self.current_screen == "game" or self.full_redraw or self.input_dirty:
+            return False
+        if self.current_screen in ["login", "signup"]:
+            return not self.get_screen(self.current_screen).animating()
+        return True
+    
     def update(self):
+        """Draw the current screen if anything on it changed and return the rects to present.
+
+        That is the whole screen after switching screens, only the regions a
+        form can change while it is up, or nothing at all for an unchanged
+        frame. The game screen runs its own loop and presents for itself.
+        """
+        rects = []
         if self.current_screen in ["login", "signup"]:
-            self.screens[self.current_screen].draw()
-        else:
-            result = self.screens[self.current_screen](self.screen)
+            # Login and signup finish on the database worker; collect their results each frame
+            form = self.get_screen(self.current_screen)
+            result = form.update()
+            if self.full_redraw or self.input_dirty or form.animating():
+                form.draw()
+                rects = [self.screen.get_rect()] if self.full_redraw else form.changing_rects()
+                self.full_redraw = self.input_dirty = False
+            self.handle_form_result(result)
+        elif self.current_screen == "game":
+            result = self.get_screen(self.current_screen)(self.screen)
             if result:
-                self.change_screen(result)
\ No newline at end of file
+                self.change_screen(result)
+        elif self.full_redraw:
+            self.get_screen(self.current_screen)(self.screen)
+            rects = [self.screen.get_rect()]
+            self.full_redraw = False
+        return rects
\ No newline at end of file
@@ -1,7 +1,9 @@
 import pygame 
 from screens.base_screen import draw_screen
+from game.assets import assets
 
-second_menu_screen_bg = pygame.image.load("./Assets/Background/second.png")
+# Decoded on first draw, not at import
+SECOND_MENU_SCREEN_BG = "./Assets/Background/second.png"
 
 def second_menu_screen(screen):
-    draw_screen(screen, second_menu_screen_bg)
\ No newline at end of file
+    draw_screen(screen, assets.image(SECOND_MENU_SCREEN_BG, alpha=False))
\ No newline at end of file
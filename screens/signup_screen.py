@@ -1,7 +1,9 @@
 import pygame
-from screens.base_screen import draw_screen
+from screens.base_screen import draw_screen, Toasts, pending_label, pending_outcome
+from game.assets import assets
 
-signup_screen_bg = pygame.image.load("./Assets/Background/signup.png")
+# Decoded on first draw, not at import
+SIGNUP_SCREEN_BG = "./Assets/Background/signup.png"
 
 class SignupScreen:
     def __init__(self, screen, settings, db):
@@ -13,16 +15,54 @@ class SignupScreen:
         self.password = ""
         self.username_active = False
         self.password_active = False
-        self.message = ""
-        self.success = False
+        self.pending = None
+        self.pending_since = 0
+        self.proceed = None
 
         self.font = pygame.font.Font(None, 32)
+        self.toasts = Toasts(self.font)
 
         self.username_rect = pygame.Rect(262, 192, 438, 45)
         self.password_rect = pygame.Rect(262, 276, 438, 45)
+        self.message_rect = pygame.Rect(0, self.password_rect.y + 50, self.screen.get_width(), 100)
         self.signup_button_rect = pygame.Rect(375, 376, 211, 55)
         self.login_button_rect = pygame.Rect(375, 457, 211, 55)
 
+    def submit(self):
+        """Start registering on the database worker; the screen keeps running."""
+        if self.pending is not None or self.proceed is not None:
+            return
+        if not (self.username and self.password):
+            self.toasts.show("Username and password cannot be empty", (255, 0, 0))
+            return
+        self.pending = self.db.signup_user_async(self.username, self.password)
+        self.pending_since = pygame.time.get_ticks()
+        # clear the username and password fields
+        self.username = ""
+        self.password = ""
+
+    def update(self):
+        """Pick up a finished signup; returns where to go next, like handle_input."""
+        outcome = None if self.pending is None else pending_outcome(self.pending, self.pending_since, self.db, self.settings.auth_timeout_ms)
+        if outcome is not None:
+            success, message = outcome
+            self.pending = None
+            self.toasts.show(message, (0, 255, 0) if success else (255, 0, 0))
+            if success:
+                # Leave the success message up briefly before moving on
+                self.proceed = pygame.time.get_ticks() + self.settings.auth_success_hold_ms
+        if self.proceed is not None and pygame.time.get_ticks() >= self.proceed:
+            self.proceed = None
+            return "login"
+        return None
+
+    def animating(self):
+        return self.pending is not None or self.proceed is not None or bool(self.toasts.messages)
+
+    def changing_rects(self):
+        """The only parts of the screen that change while it is up."""
+        return [self.username_rect, self.password_rect, self.message_rect]
+
     def handle_input(self, event):
         if event.type == pygame.QUIT:
             return "quit"
@@ -35,22 +75,7 @@ class SignupScreen:
                 self.password_active = True
                 self.username_active = False
             elif self.signup_button_rect.collidepoint(event.pos):
-                if self.username and self.password:
-                    self.success, self.message = self.db.signup_user(self.username, self.password)
-                    # clear the username and password fields
-                    self.username = ""
-                    self.password = ""
-                    if self.success:
-                        self.draw()
-                        pygame.display.flip()
-                        pygame.time.delay(2000)
-                        
-                        return "login"
-                else:
-                    self.message = "Username and password cannot be empty"
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
+                self.submit()
                     
             elif self.login_button_rect.collidepoint(event.pos):
                 return "login"
@@ -62,16 +87,7 @@ class SignupScreen:
                 elif self.password_active:
                     self.password = self.password[:-1]
             elif event.key == pygame.K_RETURN:
-                self.success, self.message = self.db.signup_user(self.username, self.password)
-                if self.success:
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
-                    return "login"
-                else:
-                    self.draw()
-                    pygame.display.flip()
-                    pygame.time.delay(2000)
+                self.submit()
                     
             else:
                 if self.username_active:
@@ -80,7 +96,7 @@ class SignupScreen:
                     self.password += event.unicode
 
     def draw(self):
-        draw_screen(self.screen, signup_screen_bg)
+        draw_screen(self.screen, assets.image(SIGNUP_SCREEN_BG, alpha=False))
         
         username_surface = self.font.render(self.username, True, (255, 255, 255))
         self.screen.blit(username_surface, (self.username_rect.x + 20, self.username_rect.y + 10))
@@ -88,10 +104,9 @@ class SignupScreen:
         password_surface = self.font.render("*" * len(self.password), True, (255, 255, 255))
         self.screen.blit(password_surface, (self.password_rect.x + 20, self.password_rect.y + 10))
 
-
-        if self.message:
-            message_color = (0, 255, 0) if self.success else (255, 0, 0)
-            message_surface = self.font.render(self.message, True, message_color)
-            message_rect = message_surface.get_rect(center=(self.screen.get_width() // 2, self.password_rect.y + 70))
-            self.screen.blit(message_surface, message_rect)
-            self.message = ""
+        message_center = (self.screen.get_width() // 2, self.password_rect.y + 70)
+        if self.pending is not None:
+            pending_surface = self.font.render(pending_label("Signing up"), True, (255, 255, 255))
+            self.screen.blit(pending_surface, pending_surface.get_rect(midleft=(message_center[0] - 60, message_center[1])))
+        else:
+            self.toasts.draw(self.screen, message_center)